@@ -54,7 +54,7 @@ def get_hazard_at(engine: GameEngine, pos: int) -> str | None:
     # We check if ANY racer on this tile has the 'BabaYagaTrip' ability.
     racers = engine.get_racers_at_position(pos)
     for r in racers:
-        if "BabaYagaTrip" in r.abilities:
+        if r.has_ability("BabaYagaTrip"):
             return f"{r.name} (Baba Yaga Power)"
 
     return None
@@ -73,7 +73,7 @@ def get_current_modifiers(engine: GameEngine, racer_idx: int) -> int:
     # 1. Gunk Effect (Global -1)
     # Check if ANY active opponent has "GunkSlow"
     is_gunked = any(
-        "GunkSlime" in r.abilities and r.active
+        r.has_ability("GunkSlime") and r.active
         for r in engine.state.racers
         if r.idx != racer_idx
     )
@@ -84,7 +84,7 @@ def get_current_modifiers(engine: GameEngine, racer_idx: int) -> int:
     # Check if ANY racer on my tile (including myself!) has "CoachAura"
     # (Coach buffs himself too, so this logic holds)
     is_coached = any(
-        "CoachAura" in r.abilities
+        r.has_ability("CoachAura")
         for r in engine.get_racers_at_position(me.position)
     )
     if is_coached:
@@ -11,8 +11,10 @@ class SandboxEngine:
 
     @classmethod
     def from_engine(cls, src: GameEngine) -> "SandboxEngine":
+        # One deepcopy covers the queue too (it lives on the state). Keep a
+        # shallow snapshot of it, since engine setup below may push events.
         state_copy = copy.deepcopy(src.state)
-        queue_copy = copy.deepcopy(src.state.queue)
+        queue_copy = list(state_copy.queue)
 
         engine_id = next(ENGINE_ID_COUNTER)
         log_ctx = LogContext(
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Protocol, runtime_checkable
 from magsim.core.events import (
     AbilityTriggeredEvent,
     AbilityTriggeredEventOrSkipped,
+    RollResultEvent,
 )
 from magsim.core.mixins import ExternalAbilityMixin
 
@@ -26,11 +27,15 @@ class Ability:
     name: AbilityName
     triggers: tuple[type[GameEvent], ...] = ()
     preferred_dice: D6VAlueSet = frozenset([4, 5, 6])
+    # Dice values this ability can react to; None means every roll.
+    # Lets the handler drop non-matching RollResultEvents before any lookups.
+    trigger_rolls: D6VAlueSet | None = None
 
     def register(self, engine: GameEngine, owner_idx: int):
         """Subscribes this ability to the engine events defined in `triggers`."""
+        handler = self._wrapped_handler
         for event_type in self.triggers:
-            engine.subscribe(event_type, self._wrapped_handler, owner_idx)
+            engine.subscribe(event_type, handler, owner_idx)
 
     def _wrapped_handler(
         self,
@@ -41,6 +46,14 @@ class Ability:
         """The internal handler that wraps the user logic.
         It checks liveness, executes logic, and automatically emits the trigger event.
         """
+        # 0. Roll-gated abilities ignore dice values they never act on
+        if (
+            self.trigger_rolls is not None
+            and isinstance(event, RollResultEvent)
+            and event.dice_value not in self.trigger_rolls
+        ):
+            return
+
         # 1. Finished or eliminated racers don't use abilities
         if (owner := engine.get_active_racer(owner_idx)) is None:
             return
@@ -144,6 +144,11 @@ class MoveDistanceQuery:
     modifiers: list[int] = field(default_factory=list)
     modifier_sources: list[tuple[str, int]] = field(default_factory=list)
 
+    def add_modifier(self, source: str, delta: int) -> None:
+        """Record a modifier together with its source."""
+        self.modifiers.append(delta)
+        self.modifier_sources.append((source, delta))
+
     @property
     def final_value(self) -> int:
         return max(0, self.base_amount + sum(self.modifiers))
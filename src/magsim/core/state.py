@@ -7,6 +7,7 @@ from magsim.core.registry import RACER_ABILITIES
 
 if TYPE_CHECKING:
     import random
+    from collections.abc import Iterable
 
     from magsim.core.abilities import Ability
     from magsim.core.events import ScheduledEvent
@@ -45,12 +46,16 @@ class ActiveRacerState(Protocol):
     roll_override: tuple[AbilityName, int] | None
     can_reroll: bool
     modifiers: list[RacerModifier]
-    active_abilities: list[Ability]
+    ability_names: frozenset[AbilityName]
 
     @property
     def repr(self) -> str: ...
     @property
     def abilities(self) -> set[AbilityName]: ...
+    @property
+    def active_abilities(self) -> tuple[Ability, ...]: ...
+
+    def has_ability(self, name: AbilityName) -> bool: ...
 
     def eliminate(self) -> None: ...
 
@@ -77,7 +82,20 @@ class RacerState:
 
     # abilities and modifiers
     modifiers: list[RacerModifier] = field(default_factory=list)
-    active_abilities: list[Ability] = field(default_factory=list)
+    # only written by set_active_abilities, so the derived views below stay in sync
+    _active_abilities: tuple[Ability, ...] = field(init=False, default=())
+    # distinct active ability names, frozen so hashing and set algebra reuse it
+    ability_names: frozenset[AbilityName] = field(
+        init=False,
+        default=frozenset(),
+        repr=False,
+    )
+    # sorted active ability names (duplicates kept), for per-event state hashing
+    ability_signature: tuple[AbilityName, ...] = field(
+        init=False,
+        default=(),
+        repr=False,
+    )
 
     @property
     def repr(self) -> str:
@@ -86,7 +104,23 @@ class RacerState:
     @property
     def abilities(self) -> set[AbilityName]:
         """Derive from active instances."""
-        return {a.name for a in self.active_abilities}
+        return set(self.ability_names)
+
+    @property
+    def active_abilities(self) -> tuple[Ability, ...]:
+        """Active instances in order; replace them via set_active_abilities."""
+        return self._active_abilities
+
+    def set_active_abilities(self, abilities: Iterable[Ability]) -> None:
+        """Replace the active abilities and rebuild the derived name views."""
+        self._active_abilities = tuple(abilities)
+        names: list[AbilityName] = [a.name for a in self._active_abilities]
+        self.ability_names = frozenset(names)
+        self.ability_signature = tuple(sorted(names))
+
+    def has_ability(self, name: AbilityName) -> bool:
+        """O(1) membership test; avoids materialising the `abilities` set."""
+        return name in self.ability_names
 
     @property
     def finished(self) -> bool:
@@ -170,7 +204,7 @@ class GameState:
                 r.finish_position,
                 r.eliminated,
                 r.victory_points,
-                frozenset(r.abilities),
+                r.ability_names,
                 frozenset(m.name for m in r.modifiers),
             )
             for r in self.racers
@@ -190,7 +224,7 @@ class GameState:
         return hash((racer_data, board_data, roll_data, queue_data))
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class TurnOutcome:
     """Result of simulating exactly one turn for a specific racer."""
 
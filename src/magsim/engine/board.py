@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import bisect
 from collections import defaultdict
 from collections.abc import Callable
 from dataclasses import dataclass, field
@@ -20,11 +21,18 @@ if TYPE_CHECKING:
     from magsim.engine.game_engine import GameEngine
 
 
+def _priority(modifier: SpaceModifier) -> int:
+    return modifier.priority
+
+
 @dataclass(slots=True)
 class Board:
     length: int
-    static_features: dict[int, list[SpaceModifier]]
+    # Tile layouts are shared between boards built from the same definition,
+    # so the per-tile collections are immutable tuples.
+    static_features: dict[int, tuple[SpaceModifier, ...]]
     second_turn: int = 15
+    # Each tile's list is kept ordered by priority as modifiers register.
     dynamic_modifiers: defaultdict[int, list[SpaceModifier]] = field(
         init=False,
         default_factory=lambda: defaultdict(list),
@@ -41,9 +49,13 @@ class Board:
         # Manual deduplication for lists
         # Because eq=True, this prevents adding a second "identical" blocker
         if modifier not in modifiers:
-            modifiers.append(modifier)
+            # insort keys right of equal priorities, matching a stable sort
+            bisect.insort(modifiers, modifier, key=_priority)
             engine.log_debug(
-                f"BOARD: Registered {modifier.name} (owner={modifier.owner_idx}) at tile {tile}",
+                "BOARD: Registered %s (owner=%s) at tile %s",
+                modifier.name,
+                modifier.owner_idx,
+                tile,
             )
 
     def unregister_modifier(
@@ -57,22 +69,33 @@ class Board:
         # eq=True makes "in" work even for new instances
         if not modifiers or modifier not in modifiers:
             engine.log_warning(
-                f"BOARD: Failed to unregister {modifier.name} from {tile} - not found.",
+                "BOARD: Failed to unregister %s from %s - not found.",
+                modifier.name,
+                tile,
             )
             return
 
         modifiers.remove(modifier)
         engine.log_debug(
-            f"BOARD: Unregistered {modifier.name} (owner={modifier.owner_idx}) from tile {tile}",
+            "BOARD: Unregistered %s (owner=%s) from tile %s",
+            modifier.name,
+            modifier.owner_idx,
+            tile,
         )
 
         if not modifiers:
             self.dynamic_modifiers.pop(tile, None)
 
     def get_modifiers_at(self, tile: int) -> list[SpaceModifier]:
-        static = self.static_features.get(tile, ())
-        dynamic = self.dynamic_modifiers.get(tile, ())
-        return sorted((*static, *dynamic), key=lambda m: m.priority)
+        static = self.static_features.get(tile)
+        dynamic = self.dynamic_modifiers.get(tile)
+        # Most tiles are empty or only carry one kind of modifier;
+        # skip building the merged tuple in those cases.
+        if not dynamic:
+            return sorted(static, key=_priority) if static else []
+        if not static:
+            return dynamic.copy()
+        return sorted((*static, *dynamic), key=_priority)
 
     def resolve_position(
         self,
@@ -149,7 +172,7 @@ class Board:
             if mods:
                 # Format each modifier as "Name(owner=ID)"
                 mod_strs = [f"{m.name}(owner={m.owner_idx})" for m in mods]
-                engine.log_info(f"  Tile {tile:02d}: {', '.join(mod_strs)}")
+                engine.log_info("  Tile %02d: %s", tile, ", ".join(mod_strs))
         engine.log_info("========================")
 
 
@@ -181,7 +204,10 @@ class MoveDeltaTile(SpaceModifier, LandingHookMixin):
             racer_idx,
         )  # uses existing GameEngine API.[file:1]
         engine.log_debug(
-            f"{self.display_name}: Queuing {self.delta} move for {racer.repr}",
+            "%s: Queuing %s move for %s",
+            self.display_name,
+            self.delta,
+            racer.repr,
         )
         # New move is a separate event, not part of the original main move.[file:1]
         push_move(
@@ -214,7 +240,7 @@ class TripTile(SpaceModifier, LandingHookMixin):
         if racer.tripped:
             return
         racer.tripped = True
-        engine.log_info(f"{self.name}: {racer.repr} is now tripped.")
+        engine.log_info("%s: %s is now tripped.", self.name, racer.repr)
 
 
 @dataclass
@@ -242,26 +268,31 @@ class VictoryPointTile(SpaceModifier, LandingHookMixin):
         racer = engine.get_racer(racer_idx)
         racer.victory_points += self.amount
         engine.log_info(
-            f"{self.display_name}: {racer.repr} gains +{self.amount} VP (now {racer.victory_points}).",
+            "%s: %s gains +%s VP (now %s).",
+            self.display_name,
+            racer.repr,
+            self.amount,
+            racer.victory_points,
         )
 
 
+WILD_WILDS_FEATURES: dict[int, tuple[SpaceModifier, ...]] = {
+    1: (VictoryPointTile(None, amount=1),),
+    5: (TripTile(None),),
+    7: (MoveDeltaTile(None, delta=3),),
+    11: (MoveDeltaTile(None, delta=1),),
+    13: (VictoryPointTile(None, amount=1),),
+    16: (MoveDeltaTile(None, delta=-4),),
+    17: (TripTile(None),),
+    23: (MoveDeltaTile(None, delta=2),),
+    24: (MoveDeltaTile(None, delta=-2),),
+    26: (TripTile(None),),
+}
+
+
 def build_wild_wilds() -> Board:
-    return Board(
-        length=30,
-        static_features={
-            1: [VictoryPointTile(None, amount=1)],
-            5: [TripTile(None)],
-            7: [MoveDeltaTile(None, delta=3)],
-            11: [MoveDeltaTile(None, delta=1)],
-            13: [VictoryPointTile(None, amount=1)],
-            16: [MoveDeltaTile(None, delta=-4)],
-            17: [TripTile(None)],
-            23: [MoveDeltaTile(None, delta=2)],
-            24: [MoveDeltaTile(None, delta=-2)],
-            26: [TripTile(None)],
-        },
-    )
+    # Copy only the outer mapping; the tile tuples are shared across boards.
+    return Board(length=30, static_features=dict(WILD_WILDS_FEATURES))
 
 
 BoardFactory = Callable[[], Board]
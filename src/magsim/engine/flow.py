@@ -13,7 +13,7 @@ if TYPE_CHECKING:
 def log_final_standings(engine: GameEngine):
     if not engine.verbose:
         return
-    engine.log_info(f"{'':>15}=== FINAL STANDINGS ===")
+    engine.log_info("               === FINAL STANDINGS ===")
     for racer in sorted(
         engine.state.racers,
         key=lambda r: r.finish_position if r.finish_position else 999,
@@ -27,7 +27,12 @@ def log_final_standings(engine: GameEngine):
         else:
             status = ""
         engine.log_info(
-            f"{'':>1}{racer.idx}•{racer.name:<8} Pos: {racer.position if racer.position else '':<4} VP: {racer.victory_points:<4} {status}",
+            " %s•%-8s Pos: %-4s VP: %-4s %s",
+            racer.idx,
+            racer.name,
+            racer.position if racer.position else "",
+            racer.victory_points,
+            status,
         )
 
 
@@ -78,7 +83,10 @@ def mark_finished(
         racer.victory_points += rewards[rank - 1]
 
     engine.log_info(
-        f"!!! {racer.repr} FINISHED rank {rank} ({racer.victory_points} VP) !!!",
+        "!!! %s FINISHED rank %s (%s VP) !!!",
+        racer.repr,
+        rank,
+        racer.victory_points,
     )
 
     # Emit event (important for listeners)
@@ -120,7 +128,9 @@ def check_race_over_condition(engine: GameEngine) -> None:
         survivor = active_racers[0]
         next_rank = count + 1
         engine.log_info(
-            f"Last survivor {survivor.repr} auto-finishes at Rank {next_rank}",
+            "Last survivor %s auto-finishes at Rank %s",
+            survivor.repr,
+            next_rank,
         )
         mark_finished(engine, survivor, rank=next_rank)
         return
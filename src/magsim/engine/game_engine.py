@@ -36,11 +36,8 @@ from magsim.core.mixins import (
     LifecycleManagedMixin,
     SetupPhaseMixin,
 )
-from magsim.core.registry import (
-    RACER_ABILITIES,
-)
 from magsim.core.state import ActiveRacerState, RollState, is_active
-from magsim.engine.logging import ContextFilter
+from magsim.engine.logging import context_extra
 from magsim.engine.loop_detection import LoopDetector
 from magsim.engine.movement import (
     handle_move_cmd,
@@ -54,7 +51,7 @@ from magsim.engine.roll import (
     handle_perform_main_roll,
     resolve_main_move,
 )
-from magsim.racers import get_ability_classes, get_all_racer_stats
+from magsim.racers import get_all_racer_stats, get_racer_ability_classes
 
 if TYPE_CHECKING:
     import random
@@ -73,23 +70,37 @@ if TYPE_CHECKING:
         Source,
     )
 
+# One logger for every engine; per-engine context rides on each record
+# (see context_extra), so engines are never pinned by the logging manager.
+ENGINE_LOGGER = logging.getLogger("magical_athlete.engine")
+
 AbilityCallback = Callable[[GameEvent, int, "GameEngine"], None]
+EventHandler = Callable[["GameEngine", Any], None]
 
 
-@dataclass
+@dataclass(slots=True)
 class Subscriber:
     callback: AbilityCallback
     owner_idx: int
 
 
-@dataclass
+@dataclass(slots=True)
 class GameEngine:
     state: GameState
     rng: random.Random
     log_context: LogContext
     current_processing_event: ScheduledEvent | None = None
-    subscribers: dict[type[GameEvent], list[Subscriber]] = field(default_factory=dict)
+    # Copy-on-write: subscribing swaps in a new tuple, so a dispatch loop
+    # always iterates an immutable snapshot.
+    subscribers: dict[type[GameEvent], tuple[Subscriber, ...]] = field(
+        default_factory=dict,
+    )
     agents: dict[int, Agent] = field(default_factory=dict)
+    # (event type, current racer) -> (source tuple, turn-ordered tuple)
+    _ordered_subscribers: dict[
+        tuple[type[GameEvent], int],
+        tuple[tuple[Subscriber, ...], tuple[Subscriber, ...]],
+    ] = field(default_factory=dict, init=False, repr=False)
 
     # Errors and loop detection
     bug_reason: ErrorCode | None = None
@@ -98,16 +109,9 @@ class GameEngine:
     # Callback for external observers
     on_event_processed: Callable[[GameEngine, GameEvent], None] | None = None
     verbose: bool = True
-    _logger: logging.Logger = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         """Assigns starting abilities to all racers and fires on_gain hooks."""
-        base = logging.getLogger("magical_athlete")
-        self._logger = base.getChild(f"engine.{id(self)}")
-
-        if self.verbose:
-            self._logger.addFilter(ContextFilter(self))
-
         for racer in self.get_active_racers():
             # 1. Initial Identity (e.g. "Egg", "Copycat")
             initial_core = self.instantiate_racer_abilities(racer.name)
@@ -159,7 +163,7 @@ class GameEngine:
         racer.main_move_consumed = False
 
         self.log_context.start_turn_log(f"{racer.idx}•{racer.name}")
-        self.log_info(f"=== START TURN: {racer.repr} ===")
+        self.log_info("=== START TURN: %s ===", racer.repr)
 
         # --- Pre-Turn Recording (for Heckler) ---
         self.push_event(
@@ -170,9 +174,10 @@ class GameEngine:
         )
 
         if racer.tripped:
-            self.log_info(f"{racer.repr} recovers from Trip.")
+            self.log_info("%s recovers from Trip.", racer.repr)
             racer.tripped = False
-            tripping_racers = racer.tripping_racers.copy()
+            # Hand the list to the event and start the racer on a fresh one
+            tripping_racers = racer.tripping_racers
             racer.tripping_racers = []
             racer.main_move_consumed = True
             self.push_event(
@@ -233,7 +238,8 @@ class GameEngine:
                 skipped = heapq.heappop(self.state.queue)
                 self.loop_detector.forget_event(skipped.serial)
                 self.log_warning(
-                    f"Infinite loop detected (Exact State Cycle). Dropping recursive event: {skipped.event}",
+                    "Infinite loop detected (Exact State Cycle). Dropping recursive event: %s",
+                    skipped.event,
                 )
                 continue
 
@@ -247,7 +253,8 @@ class GameEngine:
                 sched,
             ):
                 self.log_warning(
-                    f"MINOR_LOOP_DETECTED (Heuristic/Exploding). Dropping: {sched.event}",
+                    "MINOR_LOOP_DETECTED (Heuristic/Exploding). Dropping: %s",
+                    sched.event,
                 )
                 self.bug_reason = (
                     "MINOR_LOOP_DETECTED"
@@ -275,7 +282,7 @@ class GameEngine:
                 r.active,
                 r.tripped,
                 r.main_move_consumed,
-                tuple(sorted(a.name for a in r.active_abilities)),
+                r.ability_signature,
             )
             for r in self.state.racers
         )
@@ -290,7 +297,8 @@ class GameEngine:
             self.state.next_turn_override = None
             self.state.current_racer_idx = next_idx
             self.log_info(
-                f"Turn Order Override: {self.get_racer(next_idx).repr} takes the next turn!",
+                "Turn Order Override: %s takes the next turn!",
+                self.get_racer(next_idx).repr,
             )
             return
 
@@ -353,7 +361,7 @@ class GameEngine:
             self._calculate_board_hash(),
         )
 
-        self.log_debug(f"{sched}")
+        self.log_debug("%s", sched)
         heapq.heappush(self.state.queue, sched)
 
         if (
@@ -374,19 +382,16 @@ class GameEngine:
         callback: AbilityCallback,
         owner_idx: int,
     ):
-        if event_type not in self.subscribers:
-            self.subscribers[event_type] = []
-        self.subscribers[event_type].append(Subscriber(callback, owner_idx))
+        subs = self.subscribers.get(event_type, ())
+        self.subscribers[event_type] = (*subs, Subscriber(callback, owner_idx))
 
     def _update_abilities(self, racer_idx: int, desired_list: list[Ability]) -> None:
         """
-        Low-level reconciler. Makes racer.active_abilities (list[Ability]) match desired_list.
+        Low-level reconciler. Makes racer.active_abilities match desired_list.
         Handles Lifecycle hooks and Subscription updates.
         """
         racer = self.get_racer(racer_idx)
-        current_list = (
-            racer.active_abilities.copy()
-        )  # Make a copy to avoid stale references
+        current_list = list(racer.active_abilities)
 
         to_keep: list[Ability] = []
         to_add = list(desired_list)
@@ -409,44 +414,51 @@ class GameEngine:
         # CRITICAL: Commit the new state BEFORE calling lifecycle hooks
         # This ensures nested _update_abilities calls see the correct state
         final_list = to_keep + to_add
-        racer.active_abilities = final_list
+        racer.set_active_abilities(final_list)
+
+        # Subscriptions are not patched per ability: the rebuild in step 3
+        # re-registers everything from the committed state in one pass.
 
         # 1. Process Removal (AFTER committing state)
         for ab in to_remove:
             if isinstance(ab, LifecycleManagedMixin):
                 ab.on_loss(self, racer_idx)
 
-            # Unsubscribe Logic
-            for event_type in self.subscribers:
-                self.subscribers[event_type] = [
-                    sub
-                    for sub in self.subscribers[event_type]
-                    if not (
-                        sub.owner_idx == racer_idx
-                        and getattr(sub.callback, "__self__", None) == ab
-                    )
-                ]
-
         # 2. Process Addition (AFTER committing state)
         for ab in to_add:
-            ab.register(self, racer_idx)
             if isinstance(ab, LifecycleManagedMixin):
                 ab.on_gain(self, racer_idx)
                 # Note: on_gain may call grant_ability, which calls _update_abilities again
                 # But that's fine because we already committed the state above
 
-        # 3. Subscriber Safety Net
+        # 3. Subscriber Rebuild
         if to_remove or to_add:
             self._rebuild_subscribers()
 
     def publish_to_subscribers(self, event: GameEvent):
-        if type(event) not in self.subscribers:
+        subs = self.subscribers.get(type(event))
+        if not subs:
+            return
+
+        if len(subs) == 1:
+            # Common case: a single listener, nothing to order
+            sub = subs[0]
+            sub.callback(event, sub.owner_idx, self)
             return
 
-        subs = self.subscribers[type(event)]
+        # Subscriber tuples are replaced, never mutated, so identity alone
+        # tells whether a cached order is stale.
         curr = self.state.current_racer_idx
-        count = len(self.state.racers)
-        ordered_subs = sorted(subs, key=lambda s: (s.owner_idx - curr) % count)
+        key = (type(event), curr)
+        cached = self._ordered_subscribers.get(key)
+        if cached is not None and cached[0] is subs:
+            ordered_subs = cached[1]
+        else:
+            count = len(self.state.racers)
+            ordered_subs = tuple(
+                sorted(subs, key=lambda s: (s.owner_idx - curr) % count),
+            )
+            self._ordered_subscribers[key] = (subs, ordered_subs)
 
         for sub in ordered_subs:
             sub.callback(event, sub.owner_idx, self)
@@ -459,41 +471,9 @@ class GameEngine:
             self.on_event_processed(self, event)
 
     def _handle_event(self, event: GameEvent):
-        match event:
-            case (
-                AbilityTriggeredEvent()
-                | PreTurnStartEvent()
-                | TurnStartEvent()
-                | TurnEndEvent()
-                | PassingEvent()
-                | RollModificationWindowEvent()
-                | RollResultEvent()
-                | RacerFinishedEvent()
-                | RacerEliminatedEvent()
-            ):
-                self.publish_to_subscribers(event)
-            case TripCmdEvent():
-                handle_trip_cmd(self, event)
-            case MoveCmdEvent():
-                handle_move_cmd(self, event)
-            case SimultaneousMoveCmdEvent():
-                handle_simultaneous_move_cmd(self, event)
-            case WarpCmdEvent():
-                handle_warp_cmd(self, event)
-            case SimultaneousWarpCmdEvent():
-                handle_simultaneous_warp_cmd(self, event)
-
-            case PerformMainRollEvent():
-                handle_perform_main_roll(self, event)
-
-            case ResolveMainMoveEvent():
-                self.publish_to_subscribers(event)
-                resolve_main_move(self, event)
-            case ExecuteMainMoveEvent():
-                handle_execute_main_move(self, event)
-
-            case _:
-                pass
+        handler = EVENT_HANDLERS.get(type(event))
+        if handler is not None:
+            handler(self, event)
 
         if self.on_event_processed:
             self.on_event_processed(self, event)
@@ -509,7 +489,8 @@ class GameEngine:
         if is_active(racer := self.get_racer(idx)):
             return racer
         self.log_debug(
-            f"Attempted to get position of {racer.repr} but they were already eliminated.",
+            "Attempted to get position of %s but they were already eliminated.",
+            racer.repr,
         )
         return None
 
@@ -542,6 +523,34 @@ class GameEngine:
                 if is_active(r) and r.position == tile_idx and r.idx != except_racer_idx
             ]
 
+    def get_leading_racers(self) -> list[ActiveRacerState]:
+        """All active racers sharing the highest position, in idx order (single pass)."""
+        leaders: list[ActiveRacerState] = []
+        max_pos: int | None = None
+        for r in self.state.racers:
+            if not is_active(r):
+                continue
+            if max_pos is None or r.position > max_pos:
+                max_pos = r.position
+                leaders = [r]
+            elif r.position == max_pos:
+                leaders.append(r)
+        return leaders
+
+    def get_last_place_racers(self) -> list[ActiveRacerState]:
+        """All active racers sharing the lowest position, in idx order (single pass)."""
+        last_place: list[ActiveRacerState] = []
+        min_pos: int | None = None
+        for r in self.state.racers:
+            if not is_active(r):
+                continue
+            if min_pos is None or r.position < min_pos:
+                min_pos = r.position
+                last_place = [r]
+            elif r.position == min_pos:
+                last_place.append(r)
+        return last_place
+
     def skip_main_move(
         self,
         *,
@@ -557,7 +566,9 @@ class GameEngine:
         if not racer.main_move_consumed:
             racer.main_move_consumed = True
             self.log_info(
-                f"{racer.repr} has their main move skipped (Source: {source}).",
+                "%s has their main move skipped (Source: %s).",
+                racer.repr,
+                source,
             )
             self.push_event(
                 MainMoveSkippedEvent(
@@ -585,16 +596,7 @@ class GameEngine:
         Factory that creates fresh instances of a racer's default abilities.
         """
 
-        ability_names = RACER_ABILITIES.get(racer_name, set())
-        instances: list[Ability] = []
-        classes = get_ability_classes()
-
-        for name in ability_names:
-            cls = classes.get(name)
-            if cls:
-                instances.append(cls(name=name))
-
-        return instances
+        return [cls(name=name) for name, cls in get_racer_ability_classes(racer_name)]
 
     def replace_core_abilities(
         self,
@@ -640,10 +642,20 @@ class GameEngine:
         self._update_abilities(racer_idx, [])
 
     # -- Logging --
+    def log_enabled(self, level: int = logging.INFO) -> bool:
+        """Whether a record at `level` would be emitted; guards costly messages."""
+        return self.verbose and ENGINE_LOGGER.isEnabledFor(level)
+
     def _log(self, level: int, msg: str, *args: Any, **kwargs: Any) -> None:
-        if not self.verbose:
+        if not self.log_enabled(level):
             return
-        self._logger.log(level, msg, *args, **kwargs)
+        ENGINE_LOGGER.log(
+            level,
+            msg,
+            *args,
+            extra=context_extra(self.log_context),
+            **kwargs,
+        )
 
     def log_debug(self, msg: str, *args: Any, **kwargs: Any) -> None:
         self._log(logging.DEBUG, msg, *args, **kwargs)
@@ -656,3 +668,38 @@ class GameEngine:
 
     def log_error(self, msg: str, *args: Any, **kwargs: Any) -> None:
         self._log(logging.ERROR, msg, *args, **kwargs)
+
+
+def _publish(engine: GameEngine, event: GameEvent) -> None:
+    engine.publish_to_subscribers(event)
+
+
+def _publish_and_resolve_main_move(
+    engine: GameEngine,
+    event: ResolveMainMoveEvent,
+) -> None:
+    engine.publish_to_subscribers(event)
+    resolve_main_move(engine, event)
+
+
+# Jump table for GameEngine._handle_event, keyed by exact event type.
+# Events without an entry (e.g. PreMoveEvent) are only seen by on_event_processed.
+EVENT_HANDLERS: dict[type[GameEvent], EventHandler] = {
+    AbilityTriggeredEvent: _publish,
+    PreTurnStartEvent: _publish,
+    TurnStartEvent: _publish,
+    TurnEndEvent: _publish,
+    PassingEvent: _publish,
+    RollModificationWindowEvent: _publish,
+    RollResultEvent: _publish,
+    RacerFinishedEvent: _publish,
+    RacerEliminatedEvent: _publish,
+    TripCmdEvent: handle_trip_cmd,
+    MoveCmdEvent: handle_move_cmd,
+    SimultaneousMoveCmdEvent: handle_simultaneous_move_cmd,
+    WarpCmdEvent: handle_warp_cmd,
+    SimultaneousWarpCmdEvent: handle_simultaneous_warp_cmd,
+    PerformMainRollEvent: handle_perform_main_roll,
+    ResolveMainMoveEvent: _publish_and_resolve_main_move,
+    ExecuteMainMoveEvent: handle_execute_main_move,
+}
@@ -18,7 +18,7 @@ from magsim.core.types import (
 if TYPE_CHECKING:
     from rich.text import Text
 
-    from magsim.engine.game_engine import GameEngine
+    from magsim.core.state import LogContext
 
 RACER_NAMES = set(get_args(RacerName))
 ABILITY_NAMES = set(get_args(AbilityName))
@@ -57,23 +57,21 @@ COLOR = {
 }
 
 
-class ContextFilter(logging.Filter):
-    """Inject per-engine runtime context into every log record."""
-
-    def __init__(self, engine: GameEngine, name: str = "") -> None:
-        super().__init__(name)
-        self.engine: GameEngine = engine
-
-    @override
-    def filter(self, record: logging.LogRecord) -> bool:
-        logctx = self.engine.log_context
-        record.total_turn = logctx.total_turn
-        record.turn_log_count = logctx.turn_log_count
-        record.racer_repr = logctx.current_racer_repr
-        record.engine_id = logctx.engine_id
-        record.engine_level = logctx.engine_level
-        logctx.inc_log_count()
-        return True
+def context_extra(logctx: LogContext) -> dict[str, object]:
+    """Per-engine runtime context for one log record, passed as `extra`.
+
+    All engines share one logger, so the context travels with the record
+    instead of living in a per-engine filter.
+    """
+    extra: dict[str, object] = {
+        "total_turn": logctx.total_turn,
+        "turn_log_count": logctx.turn_log_count,
+        "racer_repr": logctx.current_racer_repr,
+        "engine_id": logctx.engine_id,
+        "engine_level": logctx.engine_level,
+    }
+    logctx.inc_log_count()
+    return extra
 
 
 class RichMarkupFormatter(logging.Formatter):
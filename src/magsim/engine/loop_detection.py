@@ -26,7 +26,7 @@ class HeuristicKey:
     phase: int | None
 
 
-@dataclass
+@dataclass(slots=True)
 class LoopTrackingData:
     """Tracks queue metrics for a specific heuristic state."""
 
@@ -34,7 +34,7 @@ class LoopTrackingData:
     visit_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class LoopDetector:
     """
     Manages multi-layered loop detection strategies.
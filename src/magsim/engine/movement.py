@@ -30,6 +30,7 @@ from magsim.engine.flow import check_finish
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    from magsim.core.state import ActiveRacerState
     from magsim.core.types import Source
     from magsim.engine.game_engine import GameEngine
 
@@ -81,7 +82,7 @@ def _resolve_move_path(
             start,
             phys_end,
         ):
-            engine.log_info(f"Move vetoed by {mod.name}")
+            engine.log_info("Move vetoed by %s", mod.name)
             if mod.owner_idx is None:
                 msg = f"MovementValidatorMixin should always have valid owner_idx but found None for {mod.name}"
                 raise ValueError(msg)
@@ -109,7 +110,9 @@ def _resolve_move_path(
     # --- 4. SAFETY CLAMP ---
     if final_end < 0:
         engine.log_info(
-            f"Attempted to move {racer.repr} to {final_end}. Instead moving to starting tile (0).",
+            "Attempted to move %s to %s. Instead moving to starting tile (0).",
+            racer.repr,
+            final_end,
         )
         final_end = 0
 
@@ -130,21 +133,27 @@ def _process_passing_and_logs(
     end_tile: int,
 ):
     racer = engine.get_racer(evt.target_racer_idx)
-    move_prefix = "Main Move" if evt.is_main else "Move"
     engine.log_info(
-        f"{move_prefix}: {racer.repr} {start_tile}->{end_tile} ({evt.source})",
+        "%s: %s %s->%s (%s)",
+        "Main Move" if evt.is_main else "Move",
+        racer.repr,
+        start_tile,
+        end_tile,
+        evt.source,
     )
 
     if evt.distance != 0:
+        # Group the other racers by tile once instead of rescanning every
+        # racer for each tile passed; idx order within a tile is preserved.
+        occupants: dict[int, list[ActiveRacerState]] = {}
+        for r in engine.get_active_racers(except_racer_idx=evt.target_racer_idx):
+            occupants.setdefault(r.position, []).append(r)
+
         step = 1 if evt.distance > 0 else -1
         current = start_tile + step
         while current != end_tile:
             if 0 <= current < engine.state.board.length:
-                victims = engine.get_racers_at_position(
-                    tile_idx=current,
-                    except_racer_idx=evt.target_racer_idx,
-                )
-                for v in victims:
+                for v in occupants.get(current, ()):
                     engine.push_event(
                         PassingEvent(
                             responsible_racer_idx=evt.target_racer_idx,
@@ -221,13 +230,9 @@ def handle_move_cmd(engine: GameEngine, evt: MoveCmdEvent):
     if end == start:
         return
 
-    # then for any ability that moves the racer (if the racer moved)
+    # then for any ability that moves the racer (the racer did move, see above)
     if evt.emit_ability_triggered == "after_resolution":
-        triggered = (
-            end != start
-        ) or engine.state.rules.count_0_moves_for_ability_triggered
-        if triggered:
-            engine.push_event(AbilityTriggeredEvent.from_event(evt))
+        engine.push_event(AbilityTriggeredEvent.from_event(evt))
 
     # lastly we handle passing
     _process_passing_and_logs(engine, evt, start, end)
@@ -236,14 +241,15 @@ def handle_move_cmd(engine: GameEngine, evt: MoveCmdEvent):
     _finalize_committed_move(engine, evt, start, end)
 
 
-def handle_simultaneous_move_cmd(engine: GameEngine, evt: SimultaneousMoveCmdEvent):
-    class PlannedMove(NamedTuple):
-        move_cmd_event: MoveCmdEvent
-        start: int
-        end: int
-        ability_triggered_events: list[AbilityTriggeredEvent]
+class _PlannedMove(NamedTuple):
+    move_cmd_event: MoveCmdEvent
+    start: int
+    end: int
+    ability_triggered_events: list[AbilityTriggeredEvent]
 
-    planned: list[PlannedMove] = []
+
+def handle_simultaneous_move_cmd(engine: GameEngine, evt: SimultaneousMoveCmdEvent):
+    planned: list[_PlannedMove] = []
 
     for move in evt.moves:
         if move.distance == 0:
@@ -268,7 +274,7 @@ def handle_simultaneous_move_cmd(engine: GameEngine, evt: SimultaneousMoveCmdEve
         end, movement_event_triggered_events = _resolve_move_path(engine, sub_evt)
 
         planned.append(
-            PlannedMove(sub_evt, start, end, movement_event_triggered_events),
+            _PlannedMove(sub_evt, start, end, movement_event_triggered_events),
         )
 
     if not planned:
@@ -317,7 +323,8 @@ def _resolve_warp_destination(
     )
     if resolved < 0:
         engine.log_info(
-            f"Attempted to warp to {resolved}. Instead moving to starting tile (0).",
+            "Attempted to warp to %s. Instead moving to starting tile (0).",
+            resolved,
         )
         resolved = 0
     return resolved
@@ -332,7 +339,12 @@ def _finalize_committed_warp(
 ):
     racer = engine.get_racer(event.target_racer_idx)
     racer.position = end_tile
-    engine.log_info(f"Warp: {racer.repr} -> {end_tile} ({event.source})")
+    engine.log_info(
+        "Warp: %s -> %s (%s)",
+        racer.repr,
+        end_tile,
+        event.source,
+    )
 
     # 1. Telemetry (ALWAYS)
     post_warp_event = PostWarpEvent(
@@ -488,7 +500,7 @@ def handle_trip_cmd(engine: GameEngine, evt: TripCmdEvent):
         return
 
     racer.tripped = True
-    engine.log_info(f"{evt.source}: {racer.repr} is now tripped.")
+    engine.log_info("%s: %s is now tripped.", evt.source, racer.repr)
 
     if evt.emit_ability_triggered != "never":
         engine.push_event(AbilityTriggeredEvent.from_event(evt))
@@ -34,6 +34,9 @@ def log_roll_breakdown(
     Logs the roll breakdown in a standardized format.
     Can be used by the main roll handler or abilities that override values (e.g. Alchemist).
     """
+    if not engine.log_enabled():
+        return
+
     roll_type = "Base Value Override" if is_override else "Dice Roll"
 
     if modifier_sources:
@@ -41,10 +44,20 @@ def log_roll_breakdown(
         mods_str = " + ".join(parts)
         total_delta = sum(delta for _, delta in modifier_sources)
         engine.log_info(
-            f"{roll_type}: {base_value} | Mods: {mods_str} = {total_delta:+d} -> Result: {final_value}",
+            "%s: %s | Mods: %s = %+d -> Result: %s",
+            roll_type,
+            base_value,
+            mods_str,
+            total_delta,
+            final_value,
         )
     else:
-        engine.log_info(f"{roll_type}: {base_value} | Mods: 0 -> Result: {final_value}")
+        engine.log_info(
+            "%s: %s | Mods: 0 -> Result: %s",
+            roll_type,
+            base_value,
+            final_value,
+        )
 
 
 def report_base_value_change(
@@ -70,20 +83,24 @@ def report_base_value_change(
 def handle_perform_main_roll(engine: GameEngine, event: PerformMainRollEvent) -> None:
     racer = engine.get_racer(event.target_racer_idx)
     if racer.tripped:
-        engine.log_info(f"Skipping roll because {racer.repr} is tripped.")
+        engine.log_info("Skipping roll because %s is tripped.", racer.repr)
         racer.main_move_consumed = True
         return
 
     if racer.main_move_consumed:
-        engine.log_info(f"Skipping roll because {racer.repr} already used main move.")
+        engine.log_info(
+            "Skipping roll because %s already used main move.",
+            racer.repr,
+        )
         return
 
-    engine.state.roll_state.serial_id += 1
-    current_serial = engine.state.roll_state.serial_id
+    roll_state = engine.state.roll_state
+    roll_state.serial_id += 1
+    current_serial = roll_state.serial_id
 
     if racer.roll_override is not None:
         source, base = racer.roll_override
-        engine.state.roll_state.dice_value = None  # Not a dice roll
+        roll_state.dice_value = None  # Not a dice roll
         racer.can_reroll = False
 
         report_base_value_change(
@@ -97,10 +114,10 @@ def handle_perform_main_roll(engine: GameEngine, event: PerformMainRollEvent) ->
         racer.roll_override = None  # Consume it
     else:
         base = cast("D6Values", engine.rng.randint(1, 6))
-        engine.state.roll_state.dice_value = base
+        roll_state.dice_value = base
         racer.can_reroll = True
 
-    engine.state.roll_state.base_value = base
+    roll_state.base_value = base
 
     query = MoveDistanceQuery(event.target_racer_idx, base)
 
@@ -110,7 +127,7 @@ def handle_perform_main_roll(engine: GameEngine, event: PerformMainRollEvent) ->
     # Capture Breakdown
     modifier_breakdown: list[RollData] = []
 
-    for mod in engine.get_racer(event.target_racer_idx).modifiers:
+    for mod in racer.modifiers:
         if isinstance(mod, RollModificationMixin):
             val_before = query.final_value
 
@@ -132,7 +149,7 @@ def handle_perform_main_roll(engine: GameEngine, event: PerformMainRollEvent) ->
                 )
 
     final = query.final_value
-    engine.state.roll_state.final_value = final
+    roll_state.final_value = final
 
     log_roll_breakdown(
         engine,
@@ -208,7 +225,8 @@ def handle_execute_main_move(engine: GameEngine, event: ExecuteMainMoveEvent) ->
 
     if racer.main_move_consumed:
         engine.log_debug(
-            f"Skipping execution: {racer.repr} main move was consumed/cancelled.",
+            "Skipping execution: %s main move was consumed/cancelled.",
+            racer.repr,
         )
         return
 
@@ -231,7 +249,9 @@ def trigger_reroll(engine: GameEngine, source_idx: int, source: Source) -> None:
     Cancels the current roll resolution and schedules a new roll immediately.
     """
     engine.log_info(
-        f"RE-ROLL TRIGGERED by {engine.get_racer(source_idx).repr} ({source})",
+        "RE-ROLL TRIGGERED by %s (%s)",
+        engine.get_racer(source_idx).repr,
+        source,
     )
     engine.state.roll_state.serial_id += 1
     engine.push_event(
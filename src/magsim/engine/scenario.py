@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-import itertools
+import functools
 import random
+import sys
+from array import array
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
-from unittest.mock import MagicMock
+from typing import TYPE_CHECKING, override
 
 from magsim.core.registry import RACER_ABILITIES
 from magsim.core.state import (
@@ -20,43 +21,101 @@ from magsim.engine.board import BOARD_DEFINITIONS, Board
 from magsim.engine.game_engine import GameEngine
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
     from magsim.core.agent import Agent
     from magsim.core.types import AbilityName, RacerName
 
 
-@dataclass
+@functools.cache
+def _default_abilities(name: RacerName) -> frozenset[AbilityName]:
+    """Validated default ability set for a racer, frozen once per name."""
+    defaults = RACER_ABILITIES.get(name)
+    if defaults is None:
+        msg = f"Racer '{name}' not found in RACER_ABILITIES."
+        raise ValueError(msg)
+
+    if not defaults:
+        msg = f"Racer '{name}' has no default abilities defined."
+        raise ValueError(msg)
+
+    return frozenset(defaults)
+
+
+@dataclass(slots=True, frozen=True)
 class RacerConfig:
     """Configuration for a single racer in a scenario."""
 
     idx: int
     name: RacerName
-    abilities: set[AbilityName] | None = None
+    abilities: frozenset[AbilityName] | None = None
     start_pos: int = 0
     agent: Agent | None = None
 
     def __post_init__(self):
+        # Names parsed from CLI/TOML are fresh strings; interning lets the
+        # registry dict lookups hit the identity fast path like literals do.
+        object.__setattr__(self, "name", sys.intern(self.name))
+
         if self.abilities is None:
-            if self.name not in RACER_ABILITIES:
-                msg = f"Racer '{self.name}' not found in RACER_ABILITIES."
-                raise ValueError(msg)
+            object.__setattr__(self, "abilities", _default_abilities(self.name))
 
-            defaults = RACER_ABILITIES[self.name]
 
-            if not defaults:
-                msg = f"Racer '{self.name}' has no default abilities defined."
-                raise ValueError(msg)
+class _DiceScript:
+    """Replays a fixed roll sequence forever in place of `randint`."""
+
+    __slots__: tuple[str, ...] = ("_idx", "_rolls")
+
+    _rolls: array[int]
+    _idx: int
+
+    def __init__(self, rolls: Iterable[int]):
+        # Dice values fit in an unsigned byte; no boxed ints kept around
+        try:
+            self._rolls = array("B", rolls)
+        except OverflowError as e:
+            msg = "Dice script rolls must be between 0 and 255."
+            raise ValueError(msg) from e
+        if not self._rolls:
+            msg = "Dice script needs at least one roll."
+            raise ValueError(msg)
+        self._idx = 0
+
+    def __call__(self, *_: int) -> int:
+        roll = self._rolls[self._idx]
+        self._idx = (self._idx + 1) % len(self._rolls)
+        return roll
 
-            self.abilities = defaults.copy()
 
+class _ScriptedRandom(random.Random):
+    """A real `Random` whose `randint` replays a dice script.
 
-@dataclass
+    sample(), choice(), shuffle() etc. keep drawing from the seeded generator,
+    without the per-call bookkeeping of a `MagicMock(wraps=...)`.
+    """
+
+    script: _DiceScript
+
+    def __init__(self, seed: int | None, script: _DiceScript):
+        super().__init__(seed)
+        self.script = script
+
+    @override
+    def randint(self, a: int, b: int) -> int:
+        return self.script(a, b)
+
+
+@dataclass(slots=True)
 class GameScenario:
     """
     A reusable harness for creating controlled game scenarios.
+
+    `dice_rolls` are replayed in an endless cycle, so tests never need to
+    patch `engine.rng.randint` themselves.
     """
 
-    racers_config: list[RacerConfig]
-    dice_rolls: list[int] | None = None
+    racers_config: Sequence[RacerConfig]
+    dice_rolls: Iterable[int] | None = None
     board: Board | None = None
     rules: GameRules | None = None
     seed: int | None = None
@@ -64,9 +123,12 @@ class GameScenario:
     # These are set in __post_init__
     state: GameState = field(init=False)
     engine: GameEngine = field(init=False)
-    mock_rng: MagicMock | None = field(init=False, default=None)
+    scripted_rng: _ScriptedRandom | None = field(init=False, default=None)
 
     def __post_init__(self):
+        # Snapshot the configs (themselves frozen) so later edits to the
+        # caller's list cannot drift from the racers built below.
+        self.racers_config = tuple(self.racers_config)
         racers: list[RacerState] = []
         agents: dict[int, Agent] = {}
 
@@ -77,21 +139,18 @@ class GameScenario:
             if cfg.agent:
                 agents[cfg.idx] = cfg.agent
 
-        # Choose RNG strategy
-        # 1. Create a real RNG base (deterministic if seed is provided)
-        base_rng = (
-            random.Random(self.seed) if self.seed is not None else random.Random()
-        )
-
+        # Choose RNG strategy: a real RNG (deterministic if seed is provided),
+        # with ONLY randint intercepted when fixed dice rolls are given.
+        rng: random.Random
         if self.dice_rolls is not None:
-            # 2. Wrap the real RNG so sample(), choices(), etc., still work natively
-            self.mock_rng = MagicMock(wraps=base_rng)
-            # 3. Intercept ONLY randint for the fixed dice rolls
-            self.mock_rng.randint.side_effect = itertools.cycle(self.dice_rolls)
-            rng = self.mock_rng
+            self.scripted_rng = _ScriptedRandom(
+                self.seed,
+                _DiceScript(self.dice_rolls),
+            )
+            rng = self.scripted_rng
         else:
-            self.mock_rng = None
-            rng = base_rng
+            self.scripted_rng = None
+            rng = random.Random(self.seed)
 
         # Initialize engine
         board = (
@@ -113,11 +172,11 @@ class GameScenario:
             agents=agents,
         )
 
-    def set_dice_rolls(self, rolls: list[int]):
-        if self.mock_rng is None:
+    def set_dice_rolls(self, rolls: Iterable[int]):
+        if self.scripted_rng is None:
             msg = "Cannot set dice rolls when using a real Random instance."
             raise ValueError(msg)
-        self.mock_rng.randint.side_effect = itertools.cycle(rolls)
+        self.scripted_rng.script = _DiceScript(rolls)
 
     def run_turn(self):
         self.engine.run_turn()
@@ -130,4 +189,10 @@ class GameScenario:
             self.run_turn()
 
     def get_racer(self, idx: int) -> RacerState:
-        return self.engine.get_racer(idx)
+        # Racer configs are indexed by position, so read the list directly
+        # instead of going through the engine.
+        return self.state.racers[idx]
+
+    def positions(self) -> tuple[int | None, ...]:
+        """Snapshot every racer's position, indexed by racer idx."""
+        return tuple(r.position for r in self.state.racers)
@@ -35,6 +35,19 @@ def get_ability_classes() -> dict[AbilityName, type[Ability]]:
     return {cls.name: cls for cls in Ability.__subclasses__()}
 
 
+@functools.cache
+def get_racer_ability_classes(
+    racer_name: RacerName,
+) -> tuple[tuple[AbilityName, type[Ability]], ...]:
+    """Resolve a racer's default ability names to their classes once."""
+    classes = get_ability_classes()
+    return tuple(
+        (name, cls)
+        for name in RACER_ABILITIES.get(racer_name, set())
+        if (cls := classes.get(name)) is not None
+    )
+
+
 @functools.cache
 def get_modifier_classes() -> dict[AbilityName | str, type[RacerModifier]]:
     return {cls.name: cls for cls in RacerModifier.__subclasses__()}
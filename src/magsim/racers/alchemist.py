@@ -73,7 +73,10 @@ class AlchemistAlchemyAbility(Ability, BooleanDecisionMixin):
         owner.can_reroll = False
 
         engine.log_info(
-            f"{owner.repr} used {self.name} to convert a {old_val} to a 4!",
+            "%s used %s to convert a %s to a 4!",
+            owner.repr,
+            self.name,
+            old_val,
         )
         log_roll_breakdown(
             engine,
@@ -124,22 +127,27 @@ class AlchemistAlchemyAbility(Ability, BooleanDecisionMixin):
 
         # 1. UPGRADE PRIORITY: If 4 is amazing (Win/VP/Boost), take it!
         if benefit := get_benefit_at(engine, target_4):
-            engine.log_info(f"{me.repr} uses {self.name} to reach {benefit}!")
+            engine.log_info("%s uses %s to reach %s!", me.repr, self.name, benefit)
             return True
 
         # 2. KEEP PRIORITY: If current roll is amazing (VP/Boost), keep it!
         if benefit := get_benefit_at(engine, target_roll):
-            engine.log_info(f"{me.repr} keeps roll to reach {benefit}!")
+            engine.log_info("%s keeps roll to reach %s!", me.repr, benefit)
             return False
 
         # 3. ESCAPE PRIORITY: If current roll trips us, upgrade to escape!
         if hazard := get_hazard_at(engine, target_roll):
-            engine.log_info(f"{me.repr} uses {self.name} to avoid {hazard}!")
+            engine.log_info("%s uses %s to avoid %s!", me.repr, self.name, hazard)
             return True
 
         # 4. SAFETY CHECK: If 4 trips us, keep the small roll (avoid the trap)
         if hazard := get_hazard_at(engine, target_4):
-            engine.log_info(f"{me.repr} does not use {self.name} because of {hazard}!")
+            engine.log_info(
+                "%s does not use %s because of %s!",
+                me.repr,
+                self.name,
+                hazard,
+            )
             return False
 
         # 5. DEFAULT: Upgrade for speed (4 > 1 or 2)
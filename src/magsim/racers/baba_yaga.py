@@ -43,7 +43,11 @@ class BabaYagaTrip(Ability):
             )
             if actual_victims := [v for v in victims if not v.tripped]:
                 engine.log_info(
-                    f"{owner.repr} moved onto {owner.position} and trips {', '.join([v.repr for v in actual_victims])} with {self.name}!",
+                    "%s moved onto %s and trips %s with %s!",
+                    owner.repr,
+                    owner.position,
+                    ", ".join([v.repr for v in actual_victims]),
+                    self.name,
                 )
             for victim in victims:
                 push_trip(
@@ -62,7 +66,10 @@ class BabaYagaTrip(Ability):
                 if not mover.tripped:
                     # only log when actually tripping
                     engine.log_info(
-                        f"{mover.repr} stepped onto {owner.repr} and trips due to {self.name}!",
+                        "%s stepped onto %s and trips due to %s!",
+                        mover.repr,
+                        owner.repr,
+                        self.name,
                     )
                 push_trip(
                     engine,
@@ -53,8 +53,7 @@ class BlimpModifier(RacerModifier, RollModificationMixin):
             delta = -1
             source = "BlimpSlow"
 
-        query.modifiers.append(delta)
-        query.modifier_sources.append((source, delta))
+        query.add_modifier(source, delta)
 
         return [
             AbilityTriggeredEvent(
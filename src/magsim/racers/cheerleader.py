@@ -46,8 +46,7 @@ class CheerleaderPepRally(Ability, BooleanDecisionMixin):
             return "skip_trigger"
 
         # Identify Last Place Racers
-        min_pos = min(r.position for r in engine.state.racers if is_active(r))
-        last_place_racers = engine.get_racers_at_position(min_pos)
+        last_place_racers = engine.get_last_place_racers()
 
         # Decision
         should_cheer = agent.make_boolean_decision(
@@ -62,12 +61,16 @@ class CheerleaderPepRally(Ability, BooleanDecisionMixin):
 
         if not should_cheer:
             engine.log_info(
-                f"{owner.repr} decided not to cheer for {' and '.join([r.repr for r in last_place_racers])} in last place!",
+                "%s decided not to cheer for %s in last place!",
+                owner.repr,
+                " and ".join([r.repr for r in last_place_racers]),
             )
             return "skip_trigger"
 
         engine.log_info(
-            f"{owner.repr} cheers for {' and '.join([r.repr for r in last_place_racers])} in last place!",
+            "%s cheers for %s in last place!",
+            owner.repr,
+            " and ".join([r.repr for r in last_place_racers]),
         )
 
         # Apply Effects
@@ -142,13 +145,18 @@ class CheerleaderPepRally(Ability, BooleanDecisionMixin):
         # 1. BENEFIT CHECK: Take if ANY spot is excellent
         for p in spots:
             if benefit := get_benefit_at(engine, p):
-                engine.log_info(f"{me.repr} uses {self.name} to reach {benefit}!")
+                engine.log_info("%s uses %s to reach %s!", me.repr, self.name, benefit)
                 return True
 
         # 2. HAZARD CHECK: Skip if ANY spot is hazardous
         for p in spots:
             if hazard := get_hazard_at(engine, p):
-                engine.log_info(f"{me.repr} avoids {self.name} because of {hazard}!")
+                engine.log_info(
+                    "%s avoids %s because of %s!",
+                    me.repr,
+                    self.name,
+                    hazard,
+                )
                 return False
 
         # 3. DEFAULT: Free movement is good
@@ -45,8 +45,7 @@ class CoachBoost(RacerModifier, RollModificationMixin):
             msg = f"owner_idx should never be None for {self.name}"
             raise ValueError(msg)
 
-        query.modifiers.append(1)
-        query.modifier_sources.append((self.name, 1))
+        query.add_modifier(self.name, 1)
 
         return [
             AbilityTriggeredEvent(
@@ -108,6 +107,10 @@ class CoachAura(Ability, LifecycleManagedMixin):
         if not isinstance(event, (PostMoveEvent, PostWarpEvent)):
             return "skip_trigger"
 
+        # Nobody changed tiles, so the aura cannot have changed either
+        if event.start_tile == event.end_tile:
+            return "skip_trigger"
+
         # check if owner (Coach) moved
         # or another racer landed on his space
         # or another racer moved away from his space
@@ -24,7 +24,7 @@ from magsim.core.events import (
     RacerFinishedEvent,
     TurnStartEvent,
 )
-from magsim.core.state import ActiveRacerState, RacerState, is_active
+from magsim.core.state import ActiveRacerState, RacerState
 from magsim.racers import get_all_racer_stats
 
 if TYPE_CHECKING:
@@ -88,22 +88,20 @@ class AbilityCopyLead(Ability, SelectionDecisionMixin[ActiveRacerState]):
         if isinstance(event, TurnStartEvent) and owner.idx == event.target_racer_idx:
             if self.current_copied_racer is None:
                 engine.log_info(
-                    f"{owner.repr} is in the sole lead and doesn't copy anyone.",
+                    "%s is in the sole lead and doesn't copy anyone.",
+                    owner.repr,
                 )
             elif self.current_copied_racer == "start_of_game":
                 pass
             else:
                 engine.log_info(
-                    f"{owner.repr} currently copies the behaviour of {self._current_copied_racer_repr}.",
+                    "%s currently copies the behaviour of %s.",
+                    owner.repr,
+                    self._current_copied_racer_repr,
                 )
 
         # 1. Determine leaders
-        active = [r for r in engine.state.racers if is_active(r)]
-        max_pos = max(r.position for r in active)
-        valid_targets = engine.get_racers_at_position(
-            max_pos,
-            except_racer_idx=owner.idx,
-        )
+        valid_targets = [r for r in engine.get_leading_racers() if r.idx != owner.idx]
 
         # 2. If Copycat leads, they lose abilities
         if not valid_targets:
@@ -116,13 +114,15 @@ class AbilityCopyLead(Ability, SelectionDecisionMixin[ActiveRacerState]):
 
             engine.replace_core_abilities(owner.idx, [self])
             engine.log_info(
-                f"{owner.repr} is in the sole lead and loses {self._current_copied_racer_repr} ability.",
+                "%s is in the sole lead and loses %s ability.",
+                owner.repr,
+                self._current_copied_racer_repr,
             )
             self.current_copied_racer = None
             return "skip_trigger"
 
-        # Sort for deterministic behavior
-        valid_targets.sort(key=lambda r: r.idx)
+        # Deterministic order for free: get_leading_racers walks state.racers
+        # by idx, so valid_targets is already sorted without a per-trigger sort.
 
         # 3. Ask the Agent which leader to copy
         target = agent.make_selection_decision(
@@ -141,12 +141,10 @@ class AbilityCopyLead(Ability, SelectionDecisionMixin[ActiveRacerState]):
 
         # Nothing new to copy
         if target is None:
-            engine.log_warning(
-                f"{owner.repr} did not copy anyone.",
-            )
+            engine.log_warning("%s did not copy anyone.", owner.repr)
             return "skip_trigger"
 
-        if target.abilities == owner.abilities.difference(
+        if target.ability_names == owner.ability_names.difference(
             {self.name},
         ):
             return "skip_trigger"
@@ -154,7 +152,10 @@ class AbilityCopyLead(Ability, SelectionDecisionMixin[ActiveRacerState]):
         self.current_copied_racer = engine.get_racer(target.idx)
 
         engine.log_info(
-            f"{owner.repr} decided to copy {self._current_copied_racer_repr} using {self.name}!",
+            "%s decided to copy %s using %s!",
+            owner.repr,
+            self._current_copied_racer_repr,
+            self.name,
         )
 
         # 4. Perform the Update
@@ -180,7 +181,7 @@ class AbilityCopyLead(Ability, SelectionDecisionMixin[ActiveRacerState]):
         ctx: SelectionDecisionContext[Self, ActiveRacerState],
     ) -> ActiveRacerState:
         # Always return the first option (deterministic tie-break)
-        # options are already sorted by idx in execute()
+        # options are already in idx order (see execute())
         return ctx.options[0]
 
     @override
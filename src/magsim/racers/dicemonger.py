@@ -89,7 +89,10 @@ class DicemongerRerollAction(Ability, BooleanDecisionMixin, ExternalAbilityMixin
         # Execute
         source_racer = engine.get_racer(self.source_racer_idx)
         engine.log_info(
-            f"{owner.repr} uses {self.name} from {source_racer.repr} to reroll!",
+            "%s uses %s from %s to reroll!",
+            owner.repr,
+            self.name,
+            source_racer.repr,
         )
         self.used_this_turn = True
 
@@ -98,7 +101,7 @@ class DicemongerRerollAction(Ability, BooleanDecisionMixin, ExternalAbilityMixin
 
         # Dicemonger Profit Logic (+1 Move)
         if owner.idx != self.source_racer_idx:
-            engine.log_info(f"{source_racer.repr} profits +1 from {self.name}.")
+            engine.log_info("%s profits +1 from %s.", source_racer.repr, self.name)
             push_move(
                 engine,
                 distance=1,
@@ -141,7 +144,7 @@ class DicemongerRerollAction(Ability, BooleanDecisionMixin, ExternalAbilityMixin
         preferred_dice = reduce(lambda a, b: a.intersection(b), preferred_dice_sets)
         preferred_dice = preferred_dice if preferred_dice else default_dice_preference
 
-        engine.log_debug(f"{preferred_dice=} for {racer.repr}")
+        engine.log_debug("preferred_dice=%r for %s", preferred_dice, racer.repr)
         return dice_val not in preferred_dice
 
 
@@ -162,7 +165,10 @@ class DicemongerRerollManager(Ability, LifecycleManagedMixin):
             # Note: ExternalAbilityMixin handles the equality logic via matches_identity
             action = DicemongerRerollAction(source_racer_idx=owner_idx)
             engine.log_debug(
-                f"{engine.get_racer(owner_idx).repr} granted {action.name} to {engine.get_racer(racer.idx).repr}",
+                "%s granted %s to %s",
+                engine.get_racer(owner_idx).repr,
+                action.name,
+                engine.get_racer(racer.idx).repr,
             )
             engine.grant_ability(racer.idx, action)
 
@@ -115,21 +115,23 @@ class DuelistAbility(
         )
 
         if target is None:
-            engine.log_info(
-                f"{owner.repr} decided not to use {self.name}!",
-            )
+            engine.log_info("%s decided not to use %s!", owner.repr, self.name)
             return "skip_trigger"
 
         # 3. Execute Duel
-        engine.log_info(
-            f"{owner.repr} challenges {target.repr} to a {self.name}!",
-        )
+        engine.log_info("%s challenges %s to a %s!", owner.repr, target.repr, self.name)
 
         owner_roll = engine.rng.randint(1, 6)
         target_roll = engine.rng.randint(1, 6)
         winner = owner if owner_roll >= target_roll else target
         engine.log_info(
-            f"{self.name}: {owner.repr} rolls a {owner_roll}, {target.repr} rolls a {target_roll} - {winner.repr} wins!",
+            "%s: %s rolls a %s, %s rolls a %s - %s wins!",
+            self.name,
+            owner.repr,
+            owner_roll,
+            target.repr,
+            target_roll,
+            winner.repr,
         )
 
         push_move(
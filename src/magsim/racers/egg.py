@@ -51,7 +51,9 @@ class EggCopyAbility(Ability, SetupPhaseMixin, SelectionDecisionMixin[RacerStat]
             and self.copied_racer is not None
         ):
             engine.log_info(
-                f"{owner.repr} acts as {self._copied_racer_repr(owner)}.",
+                "%s acts as %s.",
+                owner.repr,
+                self._copied_racer_repr(owner),
             )
         return "skip_trigger"
 
@@ -64,7 +66,9 @@ class EggCopyAbility(Ability, SetupPhaseMixin, SelectionDecisionMixin[RacerStat]
     ) -> None:
         racer_options = engine.draw_racers(k=3)
         engine.log_info(
-            f"{owner.repr} drew {', '.join(f'{r.racer_name} ({r.avg_vp:.2f} ØVP)' for r in racer_options)}.",
+            "%s drew %s.",
+            owner.repr,
+            ", ".join(f"{r.racer_name} ({r.avg_vp:.2f} ØVP)" for r in racer_options),
         )
 
         picked_racer = agent.make_selection_decision(
@@ -86,7 +90,7 @@ class EggCopyAbility(Ability, SetupPhaseMixin, SelectionDecisionMixin[RacerStat]
             )
 
         self.copied_racer = picked_racer.racer_name
-        engine.log_info(f"{owner.repr} picked {picked_racer.racer_name}!")
+        engine.log_info("%s picked %s!", owner.repr, picked_racer.racer_name)
         engine.state.remove_racers([picked_racer.racer_name])
 
         # Instantiate fresh abilities
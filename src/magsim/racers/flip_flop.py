@@ -60,10 +60,15 @@ class FlipFlopSwap(Ability, SelectionDecisionMixin[ActiveRacerState]):
             ),
         )
         if target is None:
-            engine.log_info(f"{owner.repr} decided not to use {self.name}.")
+            engine.log_info("%s decided not to use %s.", owner.repr, self.name)
             return "skip_trigger"
 
-        engine.log_info(f"{owner.repr} decided to use {self.name} on {target.repr}.")
+        engine.log_info(
+            "%s decided to use %s on %s.",
+            owner.repr,
+            self.name,
+            target.repr,
+        )
         push_simultaneous_warp(
             engine,
             warps=[
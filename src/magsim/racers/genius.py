@@ -71,7 +71,7 @@ class AbilityGenius(Ability, SelectionDecisionMixin[int]):
                 ),
             )
 
-            engine.log_info(f"{owner.repr} predicts a roll of {self.prediction}.")
+            engine.log_info("%s predicts a roll of %s.", owner.repr, self.prediction)
             return AbilityTriggeredEvent(
                 responsible_racer_idx=owner.idx,
                 source=self.name,
@@ -82,7 +82,9 @@ class AbilityGenius(Ability, SelectionDecisionMixin[int]):
         # 2. Check Phase (Roll Window)
         elif self.prediction is not None and event.current_roll_val == self.prediction:
             engine.log_info(
-                f"{self.name}: Prediction correct! {owner.repr} gets an extra turn.",
+                "%s: Prediction correct! %s gets an extra turn.",
+                self.name,
+                owner.repr,
             )
 
             # Set the override.
@@ -135,7 +137,7 @@ class AbilityGenius(Ability, SelectionDecisionMixin[int]):
 
         skipper_ability: AbilityName = "SkipperTurn"
         if owner.position >= max_pos:
-            if any(skipper_ability in r.abilities for r in active_racers if r.idx != owner.idx):
+            if any(r.has_ability(skipper_ability) for r in active_racers if r.idx != owner.idx):
                 # Conservative, but avoiding Skipper
                 prediction = 2
                 self.preferred_dice = frozenset([2, 4, 5, 6])
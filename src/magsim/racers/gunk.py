@@ -43,8 +43,7 @@ class ModifierSlime(RacerModifier, RollModificationMixin):
             msg = f"owner_idx should never be None for {self.name}"
             raise ValueError(msg)
 
-        query.modifiers.append(-1)
-        query.modifier_sources.append((self.name, -1))
+        query.add_modifier(self.name, -1)
 
         return [
             AbilityTriggeredEvent(
@@ -46,8 +46,7 @@ class HareSpeed(RacerModifier, RollModificationMixin):
 
         # +2 to main move
         if rolling_racer_idx == owner_idx:
-            query.modifiers.append(2)
-            query.modifier_sources.append((self.name, 2))
+            query.add_modifier(self.name, 2)
 
         return [
             AbilityTriggeredEvent(
@@ -87,7 +86,9 @@ class HareHubris(Ability, LifecycleManagedMixin):
                 skipped_racer_idx=owner.idx,
             )
             engine.log_info(
-                f"{owner.repr} is sole leader! {self.name} triggers - skips main move.",
+                "%s is sole leader! %s triggers - skips main move.",
+                owner.repr,
+                self.name,
             )
             return AbilityTriggeredEvent(
                 responsible_racer_idx=owner.idx,
@@ -63,7 +63,12 @@ class HecklerHeckleAbility(Ability):
             # 4. Trigger Condition: "Ended within 1 space of where they began"
             if abs(current_pos - start_pos) <= 1:
                 engine.log_info(
-                    f"{owner.repr} jeers at {active_racer.repr} with {self.name} (started at: {start_pos} - finished at: {current_pos})!",
+                    "%s jeers at %s with %s (started at: %s - finished at: %s)!",
+                    owner.repr,
+                    active_racer.repr,
+                    self.name,
+                    start_pos,
+                    current_pos,
                 )
                 # Apply the effect: Move forward 2 spaces
                 push_move(
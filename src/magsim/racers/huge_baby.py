@@ -55,7 +55,9 @@ class HugeBabyModifier(SpaceModifier, ApproachHookMixin):
             raise ValueError(msg)
 
         engine.log_info(
-            f"{engine.get_racer(moving_racer_idx).repr} got blocked by {self.display_name}!",
+            "%s got blocked by %s!",
+            engine.get_racer(moving_racer_idx).repr,
+            self.display_name,
         )
         engine.push_event(
             AbilityTriggeredEvent(
@@ -119,48 +121,46 @@ class HugeBabyPush(Ability, LifecycleManagedMixin):
             return "skip_trigger"
 
         modifier_template = HugeBabyModifier(owner_idx=owner.idx)
+        board = engine.state.board
 
         # 1. CLEANUP OLD TILE
-        if (
-            event.start_tile != 0
-            and modifier_template
-            in engine.state.board.dynamic_modifiers.get(event.start_tile, [])
+        if event.start_tile != 0 and modifier_template in board.dynamic_modifiers.get(
+            event.start_tile,
+            (),
         ):
-            engine.state.board.unregister_modifier(
-                event.start_tile,
-                modifier_template,
-                engine,
-            )
+            board.unregister_modifier(event.start_tile, modifier_template, engine)
 
         # 2. REGISTER NEW TILE
         if event.end_tile != 0 and self in owner.active_abilities:
-            engine.state.board.register_modifier(
-                event.end_tile,
-                modifier_template,
-                engine,
-            )
+            board.register_modifier(event.end_tile, modifier_template, engine)
 
             # 3. PUSH VICTIMS (Only if we successfully placed the blocker)
-            if (target := max(0, event.end_tile - 1)) >= 0:
-                victims = engine.get_racers_at_position(
-                    event.end_tile,
-                    except_racer_idx=owner.idx,
+            # One pass over the racers collects everyone sharing the tile;
+            # they are all warped back together in a single simultaneous warp.
+            victims = engine.get_racers_at_position(
+                event.end_tile,
+                except_racer_idx=owner.idx,
+            )
+            if victims:
+                target = event.end_tile - 1
+                engine.log_info(
+                    "%s landed on %s and pushes away %s using %s",
+                    owner.repr,
+                    target,
+                    ", ".join([v.repr for v in victims]),
+                    self.name,
+                )
+                warps = [
+                    WarpData(warping_racer_idx=v.idx, target_tile=target)
+                    for v in victims
+                ]
+                push_simultaneous_warp(
+                    engine,
+                    warps=warps,
+                    phase=Phase.PRE_MAIN,
+                    source=self.name,
+                    responsible_racer_idx=owner.idx,
+                    emit_ability_triggered="after_resolution",
                 )
-                if victims:
-                    engine.log_info(
-                        f"{owner.repr} landed on {target} and pushes away {', '.join([v.repr for v in victims])} using {self.name}",
-                    )
-                    warps = [
-                        WarpData(warping_racer_idx=v.idx, target_tile=target)
-                        for v in victims
-                    ]
-                    push_simultaneous_warp(
-                        engine,
-                        warps=warps,
-                        phase=Phase.PRE_MAIN,
-                        source=self.name,
-                        responsible_racer_idx=owner.idx,
-                        emit_ability_triggered="after_resolution",
-                    )
 
         return "skip_trigger"
@@ -23,6 +23,11 @@ if TYPE_CHECKING:
     from magsim.core.types import AbilityName
     from magsim.engine.game_engine import GameEngine
 
+# Racers the auto strategy never pulls onto its own tile
+HYPNOTIST_HAZARD_ABILITIES: frozenset[AbilityName] = frozenset(
+    ["MouthSwallow", "BabaYagaTrip"],
+)
+
 
 @dataclass
 class HypnotistTrance(Ability, SelectionDecisionMixin[ActiveRacerState]):
@@ -57,10 +62,14 @@ class HypnotistTrance(Ability, SelectionDecisionMixin[ActiveRacerState]):
         )
 
         if target is None:
-            engine.log_info(f"{owner.repr} decided not to use {self.name}.")
+            engine.log_info("%s decided not to use %s.", owner.repr, self.name)
             return "skip_trigger"
 
-        engine.log_info(f"{owner.repr} decided to warp {target.repr} to their space!")
+        engine.log_info(
+            "%s decided to warp %s to their space!",
+            owner.repr,
+            target.repr,
+        )
         push_warp(
             engine,
             target=owner.position,
@@ -104,11 +113,11 @@ class HypnotistTrance(Ability, SelectionDecisionMixin[ActiveRacerState]):
 
 
         # 1. Safety Filter: Strictly ban hazards
-        abilities_to_avoid: set[AbilityName] = {"MouthSwallow", "BabaYagaTrip"}
         candidates = [
             r
             for r in ctx.options
-            if abilities_to_avoid.isdisjoint(r.abilities) and r.position > me.position
+            if r.position > me.position
+            and HYPNOTIST_HAZARD_ABILITIES.isdisjoint(r.ability_names)
         ]
 
         if not candidates:
@@ -122,7 +131,7 @@ class HypnotistTrance(Ability, SelectionDecisionMixin[ActiveRacerState]):
 
         coach_ability: AbilityName = "CoachAura"
         if leader_pos < (engine.state.board.length / 2):
-            coach = next((r for r in candidates if coach_ability in r.abilities), None)
+            coach = next((r for r in candidates if r.has_ability(coach_ability)), None)
             if coach:
                 return coach
 
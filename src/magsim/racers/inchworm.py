@@ -14,7 +14,7 @@ from magsim.engine.movement import push_move
 if TYPE_CHECKING:
     from magsim.core.agent import Agent
     from magsim.core.state import ActiveRacerState
-    from magsim.core.types import AbilityName
+    from magsim.core.types import AbilityName, D6VAlueSet
     from magsim.engine.game_engine import GameEngine
 
 
@@ -22,6 +22,7 @@ if TYPE_CHECKING:
 class AbilityInchwormCreep(Ability):
     name: AbilityName = "InchwormCreep"
     triggers: tuple[type[GameEvent], ...] = (RollResultEvent,)
+    trigger_rolls: D6VAlueSet | None = frozenset([1])
 
     @override
     def execute(
@@ -38,25 +39,28 @@ class AbilityInchwormCreep(Ability):
         ):
             return "skip_trigger"
 
-        if event.dice_value == 1:
-            engine.log_info(
-                f"{owner.repr} saw a 1 and steals the move of {engine.get_racer(event.target_racer_idx).repr} with {self.name}!",
-            )
-            engine.skip_main_move(
-                responsible_racer_idx=owner.idx,
-                source=self.name,
-                skipped_racer_idx=event.target_racer_idx,
-            )
-
-            # Inchworm moves 1
-            push_move(
-                engine,
-                distance=1,
-                phase=event.phase,
-                moved_racer_idx=owner.idx,
-                source=self.name,
-                responsible_racer_idx=owner.idx,
-                emit_ability_triggered="after_resolution",
-            )
+        # trigger_rolls only lets 1s through
+        engine.log_info(
+            "%s saw a 1 and steals the move of %s with %s!",
+            owner.repr,
+            engine.get_racer(event.target_racer_idx).repr,
+            self.name,
+        )
+        engine.skip_main_move(
+            responsible_racer_idx=owner.idx,
+            source=self.name,
+            skipped_racer_idx=event.target_racer_idx,
+        )
+
+        # Inchworm moves 1
+        push_move(
+            engine,
+            distance=1,
+            phase=event.phase,
+            moved_racer_idx=owner.idx,
+            source=self.name,
+            responsible_racer_idx=owner.idx,
+            emit_ability_triggered="after_resolution",
+        )
 
         return "skip_trigger"
@@ -14,7 +14,7 @@ from magsim.engine.movement import push_move
 if TYPE_CHECKING:
     from magsim.core.agent import Agent
     from magsim.core.state import ActiveRacerState
-    from magsim.core.types import AbilityName
+    from magsim.core.types import AbilityName, D6VAlueSet
     from magsim.engine.game_engine import GameEngine
 
 
@@ -22,6 +22,7 @@ if TYPE_CHECKING:
 class AbilityLackeyLoyalty(Ability):
     name: AbilityName = "LackeyLoyalty"
     triggers: tuple[type[GameEvent], ...] = (RollResultEvent,)
+    trigger_rolls: D6VAlueSet | None = frozenset([6])
 
     @override
     def execute(
@@ -38,18 +39,20 @@ class AbilityLackeyLoyalty(Ability):
         ):
             return "skip_trigger"
 
-        if event.dice_value == 6:
-            engine.log_info(
-                f"{owner.repr} saw a 6 and rushes ahead +2 with {self.name}!",
-            )
-            push_move(
-                engine,
-                distance=2,
-                phase=event.phase,
-                moved_racer_idx=owner.idx,
-                source=self.name,
-                responsible_racer_idx=owner.idx,
-                emit_ability_triggered="after_resolution",
-            )
+        # trigger_rolls only lets 6s through
+        engine.log_info(
+            "%s saw a 6 and rushes ahead +2 with %s!",
+            owner.repr,
+            self.name,
+        )
+        push_move(
+            engine,
+            distance=2,
+            phase=event.phase,
+            moved_racer_idx=owner.idx,
+            source=self.name,
+            responsible_racer_idx=owner.idx,
+            emit_ability_triggered="after_resolution",
+        )
 
         return "skip_trigger"
@@ -63,7 +63,10 @@ class LeaptoadJumpModifier(RacerModifier, DestinationCalculatorMixin):
                 # Tile is occupied, jump over it (effectively not counting this step)
                 # We do NOT decrement 'remaining' because this step was "free"
                 engine.log_info(
-                    f"{racer.repr} used {self.name} to jump over {', '.join(r.repr for r in occupying_racers)}.",
+                    "%s used %s to jump over %s.",
+                    racer.repr,
+                    self.name,
+                    ", ".join(r.repr for r in occupying_racers),
                 )
                 current += direction
                 ability_triggered_events.append(
@@ -84,12 +84,12 @@ class LegsMoveAbility(Ability, BooleanDecisionMixin):
 
         # 1. PRIORITY: If 5 is amazing, take it!
         if benefit := get_benefit_at(engine, target_5):
-            engine.log_info(f"{me.repr} uses {self.name} to reach {benefit}!")
+            engine.log_info("%s uses %s to reach %s!", me.repr, self.name, benefit)
             return True
 
         # 2. SAFETY CHECK: If 5 trips us, avoid it.
         if hazard := get_hazard_at(engine, target_5):
-            engine.log_info(f"{me.repr} avoids {self.name} because of {hazard}!")
+            engine.log_info("%s avoids %s because of %s!", me.repr, self.name, hazard)
             return False
 
         # 3. DEFAULT: Speed is king (5 > 3.5)
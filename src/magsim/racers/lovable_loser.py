@@ -37,12 +37,16 @@ class LovableLoserBonus(Ability):
 
         others = engine.get_active_racers(except_racer_idx=owner.idx)
 
-        # Check if strictly last (no ties)
-        min_others = min(r.position for r in others)
-        if owner.position < min_others:
+        # Check if strictly last (no ties); stops at the first racer level
+        # with or behind us instead of finding the full minimum. Nobody is
+        # last when no one else is left in the race.
+        position = owner.position
+        if others and all(position < r.position for r in others):
             owner.victory_points += 1
             engine.log_info(
-                f"{owner.repr} is sole last place! Gains +1 VP (Total: {owner.victory_points}).",
+                "%s is sole last place! Gains +1 VP (Total: %s).",
+                owner.repr,
+                owner.victory_points,
             )
             return AbilityTriggeredEvent(
                 responsible_racer_idx=owner.idx,
@@ -113,19 +113,24 @@ class AbilityMagicalReroll(Ability, BooleanDecisionMixin):
 
         # 1. PRIORITY: Keep if Excellent (Win / VP / Boost)
         if benefit := get_benefit_at(engine, dest):
-            engine.log_info(f"{me.repr} keeps roll to reach {benefit}!")
+            engine.log_info("%s keeps roll to reach %s!", me.repr, benefit)
             return False
 
         # 2. AVOIDANCE: Reroll if Hazard (Trip / Backward)
         if hazard := get_hazard_at(engine, dest):
-            engine.log_info(f"{me.repr} uses {self.name} to avoid {hazard}!")
+            engine.log_info("%s uses %s to avoid %s!", me.repr, self.name, hazard)
             return True
 
         # 3. GREED: Threshold based on remaining rerolls
         threshold = 5 if self.reroll_count == 0 else 4
 
         if raw_roll < threshold:
-            engine.log_info(f"{me.repr} uses {self.name} due to low roll ({raw_roll})!")
+            engine.log_info(
+                "%s uses %s due to low roll (%s)!",
+                me.repr,
+                self.name,
+                raw_roll,
+            )
             return True
 
         return False
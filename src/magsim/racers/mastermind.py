@@ -73,7 +73,9 @@ class AbilityMastermindPredict(Ability, SelectionDecisionMixin[ActiveRacerState]
             # Store State
             self.prediction = target_racer
             engine.log_info(
-                f"{owner.repr} predicts {target_racer.repr} will win the race!",
+                "%s predicts %s will win the race!",
+                owner.repr,
+                target_racer.repr,
             )
 
             return AbilityTriggeredEvent(
@@ -91,17 +93,21 @@ class AbilityMastermindPredict(Ability, SelectionDecisionMixin[ActiveRacerState]
                 return "skip_trigger"
 
             if self.prediction is None:
-                engine.log_info(f"{owner.repr} did not predict anything!")
+                engine.log_info("%s did not predict anything!", owner.repr)
                 return "skip_trigger"
 
             if event.target_racer_idx != self.prediction.idx:
                 engine.log_info(
-                    f"{owner.repr} predicted wrong - {self.prediction.repr} did not win!",
+                    "%s predicted wrong - %s did not win!",
+                    owner.repr,
+                    self.prediction.repr,
                 )
                 return "skip_trigger"
             else:
                 engine.log_info(
-                    f"{owner.repr}'s prediction was correct! {self.prediction.repr} won!",
+                    "%s's prediction was correct! %s won!",
+                    owner.repr,
+                    self.prediction.repr,
                 )
 
                 # send to telemetry directly if prediction correct
@@ -117,7 +123,7 @@ class AbilityMastermindPredict(Ability, SelectionDecisionMixin[ActiveRacerState]
                     )
                 if engine.state.rules.hr_mastermind_steal_1st:
                     # house rule lets Mastermind steal 1st place instead
-                    engine.log_info(f"{owner.repr} steals 1st place!")
+                    engine.log_info("%s steals 1st place!", owner.repr)
                     mark_finished(
                         engine,
                         racer=engine.get_racer(event.target_racer_idx),
@@ -126,7 +132,7 @@ class AbilityMastermindPredict(Ability, SelectionDecisionMixin[ActiveRacerState]
                     mark_finished(engine, owner, 1)
                 else:
                     # If Mastermind hasn't finished yet, they take 2nd place immediately.
-                    engine.log_info(f"{owner.repr} claims 2nd place immediately!")
+                    engine.log_info("%s claims 2nd place immediately!", owner.repr)
                     mark_finished(engine, owner, 2)
 
         return "skip_trigger"
@@ -145,9 +151,8 @@ class AbilityMastermindPredict(Ability, SelectionDecisionMixin[ActiveRacerState]
             if (owner := engine.get_active_racer(ctx.source_racer_idx)) is None:
                 raise ValueError("Someone in this race has to be active")
             return owner
-        # Sort by position (descending)
-        candidates.sort(key=lambda r: r.position, reverse=True)
-        return candidates[0]
+        # Furthest ahead; max keeps the first of tied racers, like a stable sort
+        return max(candidates, key=lambda r: r.position)
 
     @override
     def get_auto_selection_decision(
@@ -158,10 +163,11 @@ class AbilityMastermindPredict(Ability, SelectionDecisionMixin[ActiveRacerState]
         """
         AI Logic: Predict the racer with the best early-game stats or position.
         """
+        option_names = {get_effective_racer_name(r) for r in ctx.options}
         candidates: list[RacerStat] = [
             stats
             for name, stats in get_all_racer_stats().items()
-            if name in [get_effective_racer_name(r) for r in ctx.options]
+            if name in option_names
         ]
         highest_winrate_racer: RacerName = max(
             candidates,
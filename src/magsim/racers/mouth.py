@@ -52,9 +52,7 @@ class MouthDevour(Ability):
         engine.clear_all_abilities(victim.idx)
         victim.eliminate()
 
-        engine.log_info(
-            f"{owner.repr} ATE {victim.repr}!!!",
-        )
+        engine.log_info("%s ATE %s!!!", owner.repr, victim.repr)
         engine.push_event(
             RacerEliminatedEvent(
                 target_racer_idx=victim.idx,
@@ -69,11 +67,12 @@ class MouthDevour(Ability):
         if active_count == 1:
             rank = sum([1 for r in engine.state.racers if r.finished]) + 1
             if rank <= 2:
-                engine.log_info(f"{owner.repr} is the last remaining racer.")
+                engine.log_info("%s is the last remaining racer.", owner.repr)
                 mark_finished(engine, racer=owner, rank=rank)
             else:
                 engine.log_error(
-                    f"Unexpected state: {owner.repr} is the last remaining racer but more than one racer has finished.",
+                    "Unexpected state: %s is the last remaining racer but more than one racer has finished.",
+                    owner.repr,
                 )
 
         return AbilityTriggeredEvent(
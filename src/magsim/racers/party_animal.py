@@ -59,8 +59,7 @@ class ModifierPartySelfBoost(RacerModifier, RollModificationMixin):
             except_racer_idx=owner_idx,
         ):
             bonus = len(guests)
-            query.modifiers.append(bonus)
-            query.modifier_sources.append((self.name, bonus))
+            query.add_modifier(self.name, bonus)
             ability_triggered_events.append(
                 AbilityTriggeredEvent(
                     owner_idx,
@@ -125,7 +124,9 @@ class PartyAnimalPull(Ability):
 
         if moves_to_make:
             engine.log_info(
-                f"{owner.repr} pulls everyone towards him using {self.name}!",
+                "%s pulls everyone towards him using %s!",
+                owner.repr,
+                self.name,
             )
             push_simultaneous_move(
                 engine,
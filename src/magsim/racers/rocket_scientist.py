@@ -49,7 +49,11 @@ class RocketScientistAbility(Ability, BooleanDecisionMixin):
 
         # Execute Boost and double dice
         engine.log_info(
-            f"{owner.repr} fires the rocket boosters and doubles the {dice_value} using {self.name} - new total is {engine.state.roll_state.final_value + dice_value}!",
+            "%s fires the rocket boosters and doubles the %s using %s - new total is %s!",
+            owner.repr,
+            dice_value,
+            self.name,
+            engine.state.roll_state.final_value + dice_value,
         )
         old_base = engine.state.roll_state.base_value
         engine.state.roll_state.base_value += dice_value
@@ -104,21 +108,21 @@ class RocketScientistAbility(Ability, BooleanDecisionMixin):
 
         # 1. WIN/BENEFIT: Double if it wins or gets VP
         if benefit := get_benefit_at(engine, target_double):
-            engine.log_info(f"{me.repr} uses {self.name} to reach {benefit}!")
+            engine.log_info("%s uses %s to reach %s!", me.repr, self.name, benefit)
             return True
 
         if benefit := get_benefit_at(engine, target_normal):
-            engine.log_info(f"{me.repr} avoids {self.name} to reach {benefit}!")
+            engine.log_info("%s avoids %s to reach %s!", me.repr, self.name, benefit)
             return False
 
         # 3. ESCAPE: Double if normal move trips us anyway (Penalty already paid)
         if hazard := get_hazard_at(engine, target_normal):
-            engine.log_info(f"{me.repr} uses {self.name} to escape {hazard}!")
+            engine.log_info("%s uses %s to escape %s!", me.repr, self.name, hazard)
             return True
 
         # 4. SAFETY: Don't double into a hazard (Double penalty: Trip + Bad Tile)
         if hazard := get_hazard_at(engine, target_double):
-            engine.log_info(f"{me.repr} avoids {self.name} due to {hazard}!")
+            engine.log_info("%s avoids %s due to %s!", me.repr, self.name, hazard)
             return False
 
         # 5. DEFAULT: Stay safe. Doubling (Trip) costs ~3.5 movement next turn.
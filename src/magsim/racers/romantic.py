@@ -38,7 +38,10 @@ class RomanticMove(Ability):
 
         if len(racers_on_tile) == 2:
             engine.log_info(
-                f"{owner.repr} got sentimental from seeing {', '.join([r.repr for r in racers_on_tile])} together and moves +2 from {self.name}",
+                "%s got sentimental from seeing %s together and moves +2 from %s",
+                owner.repr,
+                ", ".join([r.repr for r in racers_on_tile]),
+                self.name,
             )
             push_move(
                 engine,
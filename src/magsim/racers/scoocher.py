@@ -48,7 +48,11 @@ class AbilityScoochStep(Ability):
         )
 
         engine.log_info(
-            f"{owner.repr} saw {source_racer.repr} use {event.source}{target_msg} -> Queue Moving 1",
+            "%s saw %s use %s%s -> Queue Moving 1",
+            owner.repr,
+            source_racer.repr,
+            event.source,
+            target_msg,
         )
         push_move(
             engine,
@@ -20,6 +20,7 @@ class SisyphusCurse(Ability, SetupPhaseMixin):
     name: AbilityName = "SisyphusCurse"
     triggers: tuple[type[GameEvent], ...] = (RollResultEvent,)
     preferred_dice: D6VAlueSet = frozenset([1, 2, 3, 4, 5])
+    trigger_rolls: D6VAlueSet | None = frozenset([6])
 
     @override
     def on_setup(
@@ -30,7 +31,9 @@ class SisyphusCurse(Ability, SetupPhaseMixin):
     ) -> None:
         owner.victory_points += 4
         engine.log_info(
-            f"{owner.repr} starts with +4 VP (Total: {owner.victory_points}).",
+            "%s starts with +4 VP (Total: %s).",
+            owner.repr,
+            owner.victory_points,
         )
 
     @override
@@ -47,32 +50,34 @@ class SisyphusCurse(Ability, SetupPhaseMixin):
         ):
             return "skip_trigger"
 
-        if event.dice_value == 6:
-            engine.log_info(f"{owner.repr} rolled a 6! The boulder rolls back...")
+        # trigger_rolls only lets 6s through
+        engine.log_info("%s rolled a 6! The boulder rolls back...", owner.repr)
 
-            # 1. Warp to Start
-            push_warp(
-                engine,
-                target=0,
-                phase=Phase.REACTION,  # Immediate reaction
-                warped_racer_idx=owner.idx,
-                source=self.name,
-                emit_ability_triggered="after_resolution",
-                responsible_racer_idx=owner.idx,
-            )
+        # 1. Warp to Start
+        push_warp(
+            engine,
+            target=0,
+            phase=Phase.REACTION,  # Immediate reaction
+            warped_racer_idx=owner.idx,
+            source=self.name,
+            emit_ability_triggered="after_resolution",
+            responsible_racer_idx=owner.idx,
+        )
 
-            # 2. Lose Main Move
-            engine.skip_main_move(
-                responsible_racer_idx=owner.idx,
-                source=self.name,
-                skipped_racer_idx=owner.idx,
-            )
+        # 2. Lose Main Move
+        engine.skip_main_move(
+            responsible_racer_idx=owner.idx,
+            source=self.name,
+            skipped_racer_idx=owner.idx,
+        )
 
-            # 3. Lose 1 VP
-            if owner.victory_points > 0:
-                owner.victory_points -= 1
-                engine.log_info(
-                    f"{owner.repr} loses 1 VP (Total: {owner.victory_points}).",
-                )
+        # 3. Lose 1 VP
+        if owner.victory_points > 0:
+            owner.victory_points -= 1
+            engine.log_info(
+                "%s loses 1 VP (Total: %s).",
+                owner.repr,
+                owner.victory_points,
+            )
 
         return "skip_trigger"
@@ -105,7 +105,10 @@ class SuckerfishRide(Ability, BooleanDecisionMixin):
             return "skip_trigger"
 
         engine.log_info(
-            f"{owner.repr} rides the wake of {engine.get_racer(event.target_racer_idx).repr} to {event.end_tile}!",
+            "%s rides the wake of %s to %s!",
+            owner.repr,
+            engine.get_racer(event.target_racer_idx).repr,
+            event.end_tile,
         )
 
         # 1. Attach the target lock
@@ -162,7 +165,11 @@ class SuckerfishRide(Ability, BooleanDecisionMixin):
         # 0. If the driver just finished, always follow to claim 2nd place
         if not driver.active:
             if dist > 0:
-                engine.log_info(f"{me.repr} follows {driver.repr} across the finish line!")
+                engine.log_info(
+                    "%s follows %s across the finish line!",
+                    me.repr,
+                    driver.repr,
+                )
                 return True
             return False
 
@@ -181,7 +188,7 @@ class SuckerfishRide(Ability, BooleanDecisionMixin):
             "RomanticMove"
         }
 
-        driver_abilities = driver.abilities
+        driver_abilities = driver.ability_names
 
         # 1. Hard filters: obvious no-gos
         # Check if driver has Mouth ability AND is still on the board (active)
@@ -190,12 +197,15 @@ class SuckerfishRide(Ability, BooleanDecisionMixin):
 
         # 2. Immediate benefit / hazard on destination
         if (benefit := get_benefit_at(engine, dest)) is not None:
-            engine.log_info(f"{me.repr} hitchhikes to reach {benefit}!")
+            engine.log_info("%s hitchhikes to reach %s!", me.repr, benefit)
             return True
 
         if (hazard := get_hazard_at(engine, dest)) is not None:
             engine.log_info(
-                f"{me.repr} avoids hitchhiking with {driver.repr} because of {hazard}!",
+                "%s avoids hitchhiking with %s because of %s!",
+                me.repr,
+                driver.repr,
+                hazard,
             )
             return False
 
@@ -214,18 +224,24 @@ class SuckerfishRide(Ability, BooleanDecisionMixin):
 
         # 5a. Destination chain: highest priority among small safe rides
         for r in engine.get_racers_at_position(dest, except_racer_idx=me.idx):
-            if moves_before_me(r.idx) and BAD_DRIVER_ABILITIES.isdisjoint(r.abilities):
+            if moves_before_me(r.idx) and BAD_DRIVER_ABILITIES.isdisjoint(r.ability_names):
                 engine.log_info(
-                    f"{me.repr} hitchhikes with {driver.repr} to get to {r.repr}!",
+                    "%s hitchhikes with %s to get to %s!",
+                    me.repr,
+                    driver.repr,
+                    r.repr,
                 )
                 return True
 
         # 5b. Current tile: consider waiting only if no destination-chain exists
         for r in engine.get_racers_at_position(me.position, except_racer_idx=me.idx):
             # Wait for someone who moves before me AND isn't bad
-            if moves_before_me(r.idx) and BAD_DRIVER_ABILITIES.isdisjoint(r.abilities):
+            if moves_before_me(r.idx) and BAD_DRIVER_ABILITIES.isdisjoint(r.ability_names):
                 engine.log_info(
-                    f"{me.repr} waits for another rider on his tile instead of {driver.repr} (+{dist})!",
+                    "%s waits for another rider on his tile instead of %s (+%s)!",
+                    me.repr,
+                    driver.repr,
+                    dist,
                 )
                 return False
 
@@ -55,7 +55,7 @@ class ThirdWheelIntrusion(Ability, SelectionDecisionMixin[int]):
         valid_positions = [
             pos
             for pos, count in pos_counts.items()
-            if count == 2 and pos != engine.get_racer(owner.idx).position
+            if count == 2 and pos != owner.position
         ]
         if not valid_positions:
             return "skip_trigger"
@@ -78,7 +78,9 @@ class ThirdWheelIntrusion(Ability, SelectionDecisionMixin[int]):
             return "skip_trigger"
 
         engine.log_info(
-            f"{owner.repr} decided to join {' and '.join([r.repr for r in engine.get_racers_at_position(target_pos)])}!",
+            "%s decided to join %s!",
+            owner.repr,
+            " and ".join([r.repr for r in engine.get_racers_at_position(target_pos)]),
         )
         push_warp(
             engine,
@@ -136,13 +138,13 @@ class ThirdWheelIntrusion(Ability, SelectionDecisionMixin[int]):
 
             # Check if this space will trip us
             will_trip = any(m.name == "TripTile" for m in modifiers) or any(
-                "BabaYagaTrip" in r.abilities for r in racers
+                r.has_ability("BabaYagaTrip") for r in racers
             )
 
             if will_trip:
                 score -= 3.5
             else: # Coach probably left by the time we roll if we trip on arrival
-                if any("CoachAura" in r.abilities for r in racers):
+                if any(r.has_ability("CoachAura") for r in racers):
                     score += 1.0
 
             # VP Tile Bonus (valuing a VP at +2 distance equivalent)
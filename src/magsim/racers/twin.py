@@ -48,7 +48,9 @@ class TwinCopyAbility(Ability, SetupPhaseMixin, SelectionDecisionMixin[RacerStat
             and self.copied_racer is not None
         ):
             engine.log_info(
-                f"{owner.repr} acts as {self._copied_racer_repr(owner)}.",
+                "%s acts as %s.",
+                owner.repr,
+                self._copied_racer_repr(owner),
             )
         return "skip_trigger"
 
@@ -78,7 +80,12 @@ class TwinCopyAbility(Ability, SetupPhaseMixin, SelectionDecisionMixin[RacerStat
                 ],
             )
             engine.log_info(
-                f"Race {i}: {winner.racer_name} ({winner.avg_vp:.2f} ØVP, {winner.winrate * 100:.1f}% WR) won the race against {participants}",
+                "Race %s: %s (%.2f ØVP, %.1f%% WR) won the race against %s",
+                i,
+                winner.racer_name,
+                winner.avg_vp,
+                winner.winrate * 100,
+                participants,
             )
             winners.append(winner)
 
@@ -100,7 +107,7 @@ class TwinCopyAbility(Ability, SetupPhaseMixin, SelectionDecisionMixin[RacerStat
                 "Twin should always have a target to pick.",
             )
 
-        engine.log_info(f"{owner.repr} picked {picked_racer.racer_name}!")
+        engine.log_info("%s picked %s!", owner.repr, picked_racer.racer_name)
         self.copied_racer = picked_racer.racer_name
         engine.state.remove_racers([picked_racer.racer_name])
 
@@ -58,9 +58,9 @@ def run_single_simulation(
     config_hash = config.compute_hash()
 
     # Build scenario from config
-    racers_config = [
+    racers_config = tuple(
         RacerConfig(idx=i, name=name) for i, name in enumerate(config.racers)
-    ]
+    )
 
     board = BOARD_DEFINITIONS[config.board]()
 
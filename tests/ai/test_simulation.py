@@ -18,16 +18,11 @@ def test_sandbox_turn_matches_real_turn(scenario: type[GameScenario]):
     game_real = scenario(racer_cfgs, dice_rolls=[4])
     game_real.run_turn()
 
-    real_positions = [game_real.get_racer(0).position, game_real.get_racer(1).position]
-    real_tripped = [game_real.get_racer(0).tripped, game_real.get_racer(1).tripped]
-    real_eliminated = [
-        game_real.get_racer(0).eliminated,
-        game_real.get_racer(1).eliminated,
-    ]
-    real_vp_after = [
-        game_real.get_racer(0).victory_points,
-        game_real.get_racer(1).victory_points,
-    ]
+    real_racers = [game_real.get_racer(0), game_real.get_racer(1)]
+    real_positions = list(game_real.positions())
+    real_tripped = [r.tripped for r in real_racers]
+    real_eliminated = [r.eliminated for r in real_racers]
+    real_vp_after = [r.victory_points for r in real_racers]
 
     # Sandbox game (fresh instance, same starting config, same dice roll)
     game_sandbox = scenario(racer_cfgs, dice_rolls=[4])
@@ -57,26 +52,18 @@ def test_sandbox_does_not_mutate_original_state(scenario: type[GameScenario]):
         dice_rolls=[6],
     )
 
-    orig_positions = [game.get_racer(0).position, game.get_racer(1).position]
-    orig_vp = [game.get_racer(0).victory_points, game.get_racer(1).victory_points]
-    orig_tripped = [game.get_racer(0).tripped, game.get_racer(1).tripped]
-    orig_eliminated = [
-        game.get_racer(0).eliminated,
-        game.get_racer(1).eliminated,
-    ]
+    racers = [game.get_racer(0), game.get_racer(1)]
+    orig_positions = game.positions()
+    orig_vp = [r.victory_points for r in racers]
+    orig_tripped = [r.tripped for r in racers]
+    orig_eliminated = [r.eliminated for r in racers]
 
     _ = simulate_turn_for(racer_idx=game.engine.state.current_racer_idx, engine=game.engine,)
 
-    assert [game.get_racer(0).position, game.get_racer(1).position] == orig_positions
-    assert [
-        game.get_racer(0).victory_points,
-        game.get_racer(1).victory_points,
-    ] == orig_vp
-    assert [game.get_racer(0).tripped, game.get_racer(1).tripped] == orig_tripped
-    assert [
-        game.get_racer(0).eliminated,
-        game.get_racer(1).eliminated,
-    ] == orig_eliminated
+    assert game.positions() == orig_positions
+    assert [r.victory_points for r in racers] == orig_vp
+    assert [r.tripped for r in racers] == orig_tripped
+    assert [r.eliminated for r in racers] == orig_eliminated
 
 
 def test_turnoutcome_consistent_shapes(scenario: type[GameScenario]):
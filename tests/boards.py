@@ -0,0 +1,17 @@
+from magsim.engine.board import Board, MoveDeltaTile
+
+# 1. Define the custom board matching your graphic
+# Tile layout is immutable, so it is built once and shared by every board.
+GRAPHIC_BOARD_FEATURES = {
+    1: (MoveDeltaTile(delta=3),),
+    6: (MoveDeltaTile(delta=-4),),
+}
+
+
+def build_graphic_board() -> Board:
+    """
+    Reconstructs the board from the 'grafik.jpg'.
+    - Tile 3: +3 (Blue diamond)
+    - Tile 6: -4 (Red diamond)
+    """
+    return Board(length=30, static_features=dict(GRAPHIC_BOARD_FEATURES))
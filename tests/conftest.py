@@ -1,15 +1,27 @@
-from typing import Callable
+from collections.abc import Callable, Iterable, Sequence
+
 import pytest
+
 from magsim.core.state import GameRules
 from magsim.engine.board import Board
 from magsim.engine.scenario import GameScenario, RacerConfig
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def scenario() -> Callable[..., GameScenario]:
-    """Factory fixture to create scenarios."""
+    """Factory fixture to create scenarios.
+
+    The factory is stateless (every call builds a fresh GameScenario), so it is
+    shared by the whole session.
+    """
 
-    def _builder(racers_config: list[RacerConfig], dice_rolls: list[int], board: Board | None = None, rules: GameRules | None = None, seed: int | None = None) -> GameScenario:
+    def _builder(
+        racers_config: Sequence[RacerConfig],
+        dice_rolls: Iterable[int] | None = None,
+        board: Board | None = None,
+        rules: GameRules | None = None,
+        seed: int | None = None,
+    ) -> GameScenario:
         return GameScenario(racers_config, dice_rolls, board, rules, seed)
 
     return _builder
@@ -1,20 +1,7 @@
-from magsim.engine.board import Board, MoveDeltaTile
+from boards import build_graphic_board
+
 from magsim.engine.scenario import GameScenario, RacerConfig
 
-# 1. Define the custom board matching your graphic
-def build_graphic_board():
-    """
-    Reconstructs the board from the 'grafik.jpg'.
-    - Tile 3: +3 (Blue diamond)
-    - Tile 6: -4 (Red diamond)
-    """
-    return Board(
-        length=30,
-        static_features={
-            1: [MoveDeltaTile(delta=3)],
-            6: [MoveDeltaTile(delta=-4)],
-        }
-    )
 
 def test_chaos_chain_reaction(scenario: type[GameScenario]):
     """
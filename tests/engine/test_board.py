@@ -20,7 +20,7 @@ def test_redirect_into_trap(scenario: type[GameScenario]):
     )
 
     # Manually inject a trap at tile 4
-    game.engine.state.board.static_features[4] = [TripTile(None)]
+    game.engine.state.board.static_features[4] = (TripTile(None),)
 
     game.run_turn()
 
@@ -42,7 +42,7 @@ def build_finish_priority_board() -> Board:
     return Board(
         length=30,
         static_features={
-            27: [MoveDeltaTile(owner_idx=None, delta=3)],
+            27: (MoveDeltaTile(owner_idx=None, delta=3),),
         },
     )
 
@@ -92,3 +92,20 @@ def test_board_tile_priority_over_scoocher(scenario: type[GameScenario]):
     assert not (scoocher.finished and scoocher.finish_position == 1), (
         "Scoocher must not finish before Centaur in this scenario"
     )
+
+
+def test_dynamic_modifiers_are_returned_in_priority_order(scenario: type[GameScenario]):
+    """
+    Modifiers registered out of priority order still come back sorted,
+    with equal priorities kept in registration order.
+    """
+    game = scenario([RacerConfig(0, "Banana", start_pos=0)], dice_rolls=[1])
+    board = game.engine.state.board
+
+    late = MoveDeltaTile(owner_idx=None, delta=1, priority=9)
+    first = MoveDeltaTile(owner_idx=None, delta=2, priority=1)
+    second = MoveDeltaTile(owner_idx=None, delta=3, priority=1)
+    for modifier in (late, first, second):
+        board.register_modifier(12, modifier, game.engine)
+
+    assert board.get_modifiers_at(12) == [first, second, late]
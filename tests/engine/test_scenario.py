@@ -0,0 +1,51 @@
+import pytest
+
+from magsim.engine.scenario import GameScenario, RacerConfig
+
+
+def test_dice_script_cycles_through_rolls(scenario: type[GameScenario]):
+    """
+    Scripted dice repeat from the start once exhausted.
+    """
+    game = scenario([RacerConfig(0, "Banana", start_pos=0)], dice_rolls=[1, 2])
+
+    game.run_turns(3)
+
+    assert game.positions() == (4,)
+
+
+def test_empty_dice_script_is_rejected(scenario: type[GameScenario]):
+    """
+    An empty roll script fails when the scenario is built, not mid-turn.
+    """
+    with pytest.raises(ValueError, match="at least one roll"):
+        scenario([RacerConfig(0, "Banana", start_pos=0)], dice_rolls=[])
+
+
+@pytest.mark.parametrize(
+    "bad_roll",
+    [pytest.param(-1, id="negative"), pytest.param(256, id="above_byte")],
+)
+def test_out_of_range_dice_script_is_rejected(
+    scenario: type[GameScenario],
+    bad_roll: int,
+):
+    """
+    Rolls outside 0-255 get a clear error instead of an array OverflowError.
+    """
+    with pytest.raises(ValueError, match="between 0 and 255"):
+        scenario([RacerConfig(0, "Banana", start_pos=0)], dice_rolls=[1, bad_roll])
+
+
+def test_dice_script_leaves_other_draws_seeded(scenario: type[GameScenario]):
+    """
+    Only randint is scripted; sample() and friends follow the seed as usual.
+    """
+    scripted = scenario([RacerConfig(0, "Banana")], dice_rolls=[5], seed=3)
+    plain = scenario([RacerConfig(0, "Banana")], seed=3)
+
+    assert scripted.engine.rng.randint(1, 6) == 5
+    assert scripted.engine.rng.sample(range(100), 5) == plain.engine.rng.sample(
+        range(100),
+        5,
+    )
@@ -1,5 +1,3 @@
-import itertools
-
 from magsim.engine.scenario import GameScenario, RacerConfig
 
 def test_full_race_6_racers_finishes_correctly(scenario: type[GameScenario]):
@@ -20,10 +18,8 @@ def test_full_race_6_racers_finishes_correctly(scenario: type[GameScenario]):
         RacerConfig(5, "Gunk"),
     ]
     
-    # Use an infinite cycle of dice rolls to ensure the race can complete.
-    infinite_dice = itertools.cycle([4, 5, 6, 3, 2, 4])
-    game = scenario(racers, dice_rolls=list(itertools.islice(infinite_dice, 100))) 
-    game.engine.rng.randint.side_effect = infinite_dice
+    # The scenario cycles dice_rolls forever, so the race can always complete.
+    game = scenario(racers, dice_rolls=[2, 4, 4, 5, 6, 3])
 
     # Run the entire race to completion
     game.engine.run_race()
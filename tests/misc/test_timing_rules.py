@@ -1,21 +1,8 @@
+from boards import build_graphic_board
+
 from magsim.core.state import GameRules
-from magsim.engine.board import Board, MoveDeltaTile
 from magsim.engine.scenario import GameScenario, RacerConfig
 
-# 1. Define the custom board matching your graphic
-def build_graphic_board():
-    """
-    Reconstructs the board from the 'grafik.jpg'.
-    - Tile 3: +3 (Blue diamond)
-    - Tile 6: -4 (Red diamond)
-    """
-    return Board(
-        length=30,
-        static_features={
-            1: [MoveDeltaTile(delta=3)],
-            6: [MoveDeltaTile(delta=-4)],
-        }
-    )
 
 def test_chaos_chain_reaction_DFS(scenario: type[GameScenario]):
     """Complex scenario to test a chain reaction and resolve order as well as loop detection.
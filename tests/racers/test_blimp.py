@@ -10,13 +10,9 @@ def test_blimp_speed_bonus_threshold(scenario: type[GameScenario]):
     game = scenario(
         [
             RacerConfig(0, "Blimp", start_pos=10),
-            RacerConfig(1, "Mastermind", start_pos=0), 
-        ],
-        dice_rolls=[
-            2, 
-            2,
-            3, 
+            RacerConfig(1, "Mastermind", start_pos=0),
         ],
+        dice_rolls=[2, 2, 3],
     )
 
     # --- Turn 1 ---
@@ -47,16 +47,17 @@ def test_centaur_ignore_finished_racers(scenario: type[GameScenario]):
         ],
         dice_rolls=[6],
     )
-    game.get_racer(1).finish_position = 1
+    centaur, scoocher = game.get_racer(0), game.get_racer(1)
+    scoocher.finish_position = 1
 
     game.run_turn()
 
-    assert game.get_racer(1).position == 30
-    assert game.get_racer(1).finished is True
-    
+    assert scoocher.position == 30
+    assert scoocher.finished is True
+
     # Centaur 27 -> 33 (Finish)
-    assert game.get_racer(0).finished is True
-    assert game.get_racer(0).finish_position == 2
+    assert centaur.finished is True
+    assert centaur.finish_position == 2
 
 
 def test_centaur_trample_triggers_on_passive_move(scenario: type[GameScenario]):
@@ -1,26 +1,58 @@
+import pytest
+
 from magsim.ai.baseline_agent import BaselineAgent
+from magsim.core.types import AbilityName
 from magsim.engine.scenario import GameScenario, RacerConfig
 from magsim.racers.copycat import AbilityCopyLead
 
 
-def test_copycat_basic_ability_gain(scenario: type[GameScenario]):
+@pytest.mark.parametrize(
+    ("racers", "roll", "expected_ability", "expected_positions"),
+    [
+        pytest.param(
+            [
+                RacerConfig(0, "Copycat", start_pos=5),
+                RacerConfig(1, "Scoocher", start_pos=7),  # Victim
+                RacerConfig(2, "Centaur", start_pos=10),
+            ],
+            4,  # Copycat moves 5 -> 9, passing Scoocher
+            "CentaurTrample",
+            # Copycat trampling logic: 5 -> 9. Scoocher pushed back.
+            {0: 9, 1: 7},
+            id="centaur_trample_used",
+        ),
+        pytest.param(
+            [
+                RacerConfig(0, "Copycat", start_pos=0),
+                RacerConfig(1, "Gunk", start_pos=10),
+                RacerConfig(2, "Banana", start_pos=5),
+            ],
+            1,  # Copied slime cancels the roll
+            "GunkSlime",
+            {0: 0},
+            id="gunk_slime",
+        ),
+    ],
+)
+def test_copycat_copies_sole_leader(
+    scenario: type[GameScenario],
+    racers: list[RacerConfig],
+    roll: int,
+    expected_ability: AbilityName,
+    expected_positions: dict[int, int],
+):
     """
-    Copycat copies the leader (Centaur) and uses the gained ability (Trample).
+    Copycat gains the ability of whichever racer is in the sole lead
+    and uses it on the same turn.
     """
-    game = scenario(
-        [
-            RacerConfig(0, "Copycat", start_pos=5),
-            RacerConfig(1, "Scoocher", start_pos=7),  # Victim
-            RacerConfig(2, "Centaur", start_pos=10),
-        ],
-        dice_rolls=[4],  # Copycat moves 5 -> 9, passing Scoocher
-    )
+    game = scenario(racers, dice_rolls=[roll])
 
     game.run_turn()
 
-    # Copycat trampling logic: 5 -> 9. Scoocher pushed back.
-    assert game.get_racer(0).position == 9
-    assert game.get_racer(1).position == 7
+    assert game.get_racer(0).abilities == {"CopyLead", expected_ability}
+    assert {
+        idx: game.get_racer(idx).position for idx in expected_positions
+    } == expected_positions
 
 
 def test_copycat_deterministic_tie_break(scenario: type[GameScenario]):
@@ -60,10 +92,9 @@ def test_copycat_ability_loss_and_modifier_cleanup(scenario: type[GameScenario])
         dice_rolls=[1, 4, 8, 1, 1],
     )
 
-    game.run_turns(3)  # Baby moves, Copycat copies/places blocker, Centaur takes lead
-
-    # Turn 4: Copycat copies Centaur, losing HugeBabyPush -> Blocker removed.
-    game.run_turn()
+    # Baby moves, Copycat copies/places blocker, Centaur takes lead,
+    # then Turn 4: Copycat copies Centaur, losing HugeBabyPush -> Blocker removed.
+    game.run_turns(4)
 
     assert game.get_racer(1).position == 2
     
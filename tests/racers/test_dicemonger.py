@@ -83,7 +83,7 @@ def test_dicemonger_cleanup_on_finish(scenario: type[GameScenario]):
     """
     game = scenario(
         [
-            RacerConfig(0, "Dicemonger", start_pos=28), 
+            RacerConfig(0, "Dicemonger", start_pos=28),
             RacerConfig(1, "Banana", start_pos=0),
         ],
         dice_rolls=[6],
@@ -93,7 +93,7 @@ def test_dicemonger_cleanup_on_finish(scenario: type[GameScenario]):
         isinstance(a, DicemongerRerollAction) for a in game.get_racer(1).active_abilities
     )
 
-    game.run_turn() 
+    game.run_turn()
 
     assert not any(
         isinstance(a, DicemongerRerollAction) for a in game.get_racer(1).active_abilities
@@ -116,13 +116,8 @@ def test_double_reroll_sequential_usage(scenario: type[GameScenario]):
 
     game.run_turns(2)
 
-    dicemonger = game.get_racer(0)
-    banana = game.get_racer(1)
-    copycat = game.get_racer(2)
-
-    assert banana.position == 9
-    assert dicemonger.position == 11
-    assert copycat.position == 1
+    # Dicemonger, Banana, Copycat
+    assert game.positions() == (11, 9, 1)
 
 
 def test_multiple_dicemongers_independent_profit(scenario: type[GameScenario]):
@@ -145,10 +140,10 @@ def test_multiple_dicemongers_independent_profit(scenario: type[GameScenario]):
     )
 
     game.run_turns(2) # Setup
-    
+
     # We verify independent profit by checking if only ONE moves +1.
     # To force a specific choice or detect which was used, we check who moved.
-    
+
     d_pos_before = game.get_racer(0).position # 10
     c_pos_before = game.get_racer(1).position # 4
 
@@ -165,5 +160,5 @@ def test_multiple_dicemongers_independent_profit(scenario: type[GameScenario]):
     # Verify exclusivity: Only one of them should have gained +1
     dicemonger_profited = (d_pos_after == d_pos_before + 1)
     copycat_profited = (c_pos_after == c_pos_before + 1)
-    
+
     assert dicemonger_profited != copycat_profited, "Only ONE source should profit per reroll."
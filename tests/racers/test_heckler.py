@@ -16,11 +16,8 @@ def test_heckler_basic_jeer(scenario: type[GameScenario]):
 
     game.run_turns(2)
 
-    heckler = game.get_racer(0)
-    banana = game.get_racer(1)
-
-    assert banana.position == 6
-    assert heckler.position == 5
+    # Heckler, Banana
+    assert game.positions() == (5, 6)
 
 
 def test_heckler_no_jeer_on_big_move(scenario: type[GameScenario]):
@@ -80,15 +77,13 @@ def test_heckler_trip_recovery(scenario: type[GameScenario]):
 
     heckler = game.get_racer(0)
     gunk = game.get_racer(1)
-    banana = game.get_racer(2)
 
     heckler.tripped = True
     gunk.tripped = True
     game.run_turns(2)
 
-    assert heckler.position == 4
-    assert gunk.position == 5
-    assert banana.position == 3
+    # Heckler, Gunk, Banana
+    assert game.positions() == (4, 5, 3)
     
     assert heckler.tripped == True # trips again on Banana
     assert gunk.tripped == False
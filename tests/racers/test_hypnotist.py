@@ -17,13 +17,8 @@ def test_hypnotist_warps_furthest_ahead_target(scenario: type[GameScenario]):
 
     game.run_turn()
 
-    hypnotist = game.get_racer(0)
-    banana = game.get_racer(1)
-    centaur = game.get_racer(2)
-
-    assert centaur.position == 3
-    assert banana.position == 8
-    assert hypnotist.position == 7
+    # Hypnotist, Banana, Centaur
+    assert game.positions() == (7, 8, 3)
 
 
 def test_hypnotist_does_nothing_when_in_lead(scenario: type[GameScenario]):
@@ -42,13 +37,8 @@ def test_hypnotist_does_nothing_when_in_lead(scenario: type[GameScenario]):
 
     game.run_turn()
 
-    hypnotist = game.get_racer(0)
-    banana = game.get_racer(1)
-    centaur = game.get_racer(2)
-
-    assert hypnotist.position == 12
-    assert banana.position == 8
-    assert centaur.position == 9
+    # Hypnotist, Banana, Centaur
+    assert game.positions() == (12, 8, 9)
 
 
 def test_hypnotist_warp_while_recovering(scenario: type[GameScenario]):
@@ -95,13 +85,8 @@ def test_hypnotist_can_warp_finished_racer_is_ignored(scenario: type[GameScenari
 
     game.run_turn()
 
-    hypnotist = game.get_racer(0)
-    banana = game.get_racer(1)
-    centaur = game.get_racer(2)
-
-    assert banana.position == 0
-    assert centaur.position == 30
-    assert hypnotist.position == 3
+    # Hypnotist, Banana, Centaur
+    assert game.positions() == (3, 0, 30)
 
 
 def test_hypnotist_copycat_copies_and_warps(scenario: type[GameScenario]):
@@ -121,11 +106,6 @@ def test_hypnotist_copycat_copies_and_warps(scenario: type[GameScenario]):
 
     game.run_turns(3)
 
-    banana = game.get_racer(0)
-    copycat = game.get_racer(1)
-    hypnotist = game.get_racer(2)
-
-    assert "BananaTrip" not in copycat.abilities
-    assert banana.position == 0
-    assert copycat.position == 4
-    assert hypnotist.position == 2
+    assert not game.get_racer(1).has_ability("BananaTrip")
+    # Banana, Copycat, Hypnotist
+    assert game.positions() == (0, 4, 2)
@@ -15,8 +15,7 @@ def test_inchworm_cancels_opponent_rolling_one(scenario: type[GameScenario]):
         dice_rolls=[2, 1],  # Inchworm rolls 2, Centaur rolls 1
     )
 
-    game.run_turn()  # Inchworm turn
-    game.run_turn()  # Centaur turn
+    game.run_turns(2)  # Inchworm turn, then Centaur turn
 
     inchworm = game.get_racer(0)
     centaur = game.get_racer(1)
@@ -42,11 +42,9 @@ def test_leaptoad_stickler_interaction(scenario: type[GameScenario]):
         ],
     )
 
-    # Stickler moves
-    game.run_turn()
-
-    # Leaptoad moves. 28 + 1 (jump over 29) = 30. Valid exact finish.
-    game.run_turn()
+    # Stickler moves, then Leaptoad moves.
+    # 28 + 1 (jump over 29) = 30. Valid exact finish.
+    game.run_turns(2)
     leaptoad = game.get_racer(1)
     assert leaptoad.position == 30
     assert leaptoad.finished
@@ -71,9 +69,7 @@ def test_leaptoad_stickler_interaction_failure(scenario: type[GameScenario]):
         ],
     )
     
-    game.run_turn() # Stickler
-    
-    game.run_turn() # Leaptoad
+    game.run_turns(2) # Stickler, then Leaptoad
     leaptoad = game.get_racer(1)
     
     # Should stay at 28 because 31 is invalid according to Stickler
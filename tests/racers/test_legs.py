@@ -1,4 +1,4 @@
-from magsim.engine.scenario import RacerConfig, GameScenario
+from magsim.engine.scenario import GameScenario, RacerConfig
 
 
 def test_legs_uses_ability_moves_5(scenario: type[GameScenario]):
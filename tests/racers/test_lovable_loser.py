@@ -33,3 +33,19 @@ def test_lovable_loser_no_gain_if_tied(scenario: type[GameScenario]):
     game.run_turn()
     loser = game.get_racer(0)
     assert loser.victory_points == 0, "Should NOT gain VP if tied for last"
+
+
+def test_lovable_loser_no_gain_when_alone(scenario: type[GameScenario]):
+    """Lovable Loser gains nothing when no other racer is still active."""
+    game = scenario(
+        [
+            RacerConfig(0, "LovableLoser", start_pos=0),
+            RacerConfig(1, "Banana", start_pos=5),
+        ],
+        dice_rolls=[1],
+    )
+    game.get_racer(1).eliminate()
+
+    game.run_turn()
+    loser = game.get_racer(0)
+    assert loser.victory_points == 0, "Should NOT gain VP without rivals"